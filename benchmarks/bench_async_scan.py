@@ -0,0 +1,63 @@
+"""Latency of pipeline_core.async_scan against a synthetic slow filesystem.
+
+Each directory listing sleeps for a configurable time to mimic a slow share.
+The harness measures how long the "UI thread" is blocked per click, how long
+results take to arrive, and how many stale results are dropped when the user
+clicks through several entries quickly.
+
+Run from the repository root:  python -m benchmarks.bench_async_scan [latency_ms]
+"""
+import queue
+import sys
+import time
+
+from pipeline_core.async_scan import ScanService
+
+
+def slow_listdir(path, latency):
+    time.sleep(latency)
+    return [f"{path}_{i:03d}" for i in range(50)]
+
+
+def main(latency_ms=200, clicks=12):
+    latency = latency_ms / 1000.0
+    main_loop = queue.Queue()
+    service = ScanService(deliver=main_loop.put)
+    delivered = []
+
+    # Synchronous baseline: the UI thread waits for every listing
+    start = time.perf_counter()
+    for i in range(clicks):
+        slow_listdir(f"SQ{i:02d}", latency)
+    sync_blocked = time.perf_counter() - start
+
+    # Background: the user clicks through entries faster than the share answers
+    start = time.perf_counter()
+    for i in range(clicks):
+        service.submit("shot_combo", slow_listdir, f"SQ{i:02d}", latency, on_result=delivered.append)
+        time.sleep(latency / 10)
+    async_blocked = time.perf_counter() - start - clicks * latency / 10
+
+    deadline = time.time() + latency * clicks + 1
+    while not delivered and time.time() < deadline:
+        try:
+            main_loop.get(timeout=0.05)()
+        except queue.Empty:
+            pass
+    # Let the remaining stale results drain
+    time.sleep(latency)
+    while not main_loop.empty():
+        main_loop.get()()
+
+    print(f"simulated listing latency : {latency_ms} ms, {clicks} clicks")
+    print(f"UI blocked (synchronous)  : {sync_blocked * 1000:8.2f} ms")
+    print(f"UI blocked (background)   : {async_blocked * 1000:8.2f} ms")
+    for channel, seconds in service.latencies:
+        print(f"delivered on {channel:<12}: {seconds * 1000:8.2f} ms after submit")
+    print(f"results delivered         : {len(delivered)} (last request: {delivered[-1][0] if delivered else None})")
+    print(f"stale results dropped     : {service.stale_count}")
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+"""Cold vs warm benchmark for pipeline_core.file_index against the old rglob scans.
+
+Run from the repository root:  python -m benchmarks.bench_file_index
+"""
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_project import count_files, make_project
+from pipeline_core.file_index import ProjectFileIndex
+
+
+def rglob_lookup(root, asset):
+    # What listAssetFiles used to do: names and paths, publish and wip, four walks.
+    results = []
+    for kind in ("publish", "wip"):
+        for want_path in (False, True):
+            for path in Path(root, kind).rglob(asset + "*"):
+                results.append(str(path) if want_path else path.name)
+    return results
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sequences=4, shots=10, versions=20):
+    root = make_project(sequences=sequences, shots=shots, versions=versions)
+    try:
+        print(f"project: {root} ({count_files(root)} files)")
+        asset = "char007"
+
+        old_time, _ = timed(rglob_lookup, root, asset)
+        print(f"rglob listAssetFiles : {old_time * 1000:8.2f} ms")
+
+        index = ProjectFileIndex(root)
+        cold_time, _ = timed(index.refresh)
+        print(f"index cold build     : {cold_time * 1000:8.2f} ms")
+
+        index = ProjectFileIndex(root)
+        load_time, _ = timed(index.load)
+        warm_time, _ = timed(index.refresh)
+        print(f"index load from disk : {load_time * 1000:8.2f} ms")
+        print(f"index warm refresh   : {warm_time * 1000:8.2f} ms")
+
+        lookup_time, found = timed(index.find, asset)
+        print(f"index lookup         : {lookup_time * 1000:8.3f} ms ({len(found)} files)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
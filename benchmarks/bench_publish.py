@@ -0,0 +1,116 @@
+"""Wall-clock time of a multi-format publish with slow stubbed exporters.
+
+Run from the repository root:  python -m benchmarks.bench_publish [export_ms]
+
+maya is the recording stub and every export sleeps for export_ms first.
+mb, abc, fbx and usd are published into a synthetic shot twice: once all
+on the main thread, once with abc, fbx and usd in batch workers.  The
+workers are real processes, started through a stand-in mayapy that
+installs the same slow stub before running pipeline_core.batch_export.
+
+While each publish runs the export folder is listed over and over; any
+empty or half-written version that shows up before the publish is done is
+reported.
+"""
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks import maya_stub
+from benchmarks.synthetic_project import make_project
+
+EXPORT_SIZE = 64 * 1024
+FORMATS = ["mb", "abc", "fbx", "usd"]
+SECONDS_VARIABLE = "BENCH_PUBLISH_EXPORT_SECONDS"
+
+_MAYAPY = """#!{python}
+import sys
+sys.path.insert(0, {root!r})
+from benchmarks.bench_publish import worker
+sys.exit(worker(sys.argv[1:]))
+"""
+
+
+def worker(argv):
+    """Stand-in mayapy: argv is ["-m", "pipeline_core.batch_export", ...]."""
+    cmds = maya_stub.install(export_size=EXPORT_SIZE)
+    maya_stub.slow_exports(cmds, float(os.environ[SECONDS_VARIABLE]))
+    from pipeline_core import batch_export
+    return batch_export.main(argv[2:])
+
+
+def make_mayapy(folder):
+    path = os.path.join(folder, "mayapy")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(path, "w") as handle:
+        handle.write(_MAYAPY.format(python=sys.executable, root=root))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+
+class FolderWatch(threading.Thread):
+    """Lists folder until stopped, keeping every versioned file seen smaller than a full export."""
+
+    def __init__(self, folder):
+        super(FolderWatch, self).__init__(daemon=True)
+        self.folder = folder
+        self.before = set(os.listdir(folder))
+        self.partial = set()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            for name in set(os.listdir(self.folder)) - self.before:
+                path = os.path.join(self.folder, name)
+                if os.path.splitext(name)[1].lstrip(".") in FORMATS and os.path.isfile(path):
+                    try:
+                        if os.path.getsize(path) < EXPORT_SIZE:
+                            self.partial.add(name)
+                    except OSError:
+                        pass
+            time.sleep(0.001)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def publish(save_system, workers):
+    save_system.batch_workers = workers
+    watch = FolderWatch(save_system.export_path)
+    watch.start()
+    start = time.perf_counter()
+    report = save_system.publish("hero", FORMATS)
+    seconds = time.perf_counter() - start
+    watch.stop()
+    if not report.ok:
+        raise RuntimeError("; ".join(str(result.error) for result in report.results if not result.ok))
+    return seconds, report, watch.partial
+
+
+def main(export_ms=500):
+    seconds = export_ms / 1000.0
+    os.environ[SECONDS_VARIABLE] = str(seconds)
+    cmds = maya_stub.install(selection=["char_grp"], export_size=EXPORT_SIZE)
+    maya_stub.slow_exports(cmds, seconds)
+    from pipeline_core.save_system import ArtistsTimeSortingSaveSystem
+
+    root = make_project(sequences=1, shots=1, versions=2, characters=0)
+    os.environ["MAYAPY"] = make_mayapy(tempfile.mkdtemp(prefix="bench_mayapy_"))
+    save_system = ArtistsTimeSortingSaveSystem()
+    save_system.set_export_path(os.path.join(root, "publish", "sequence", "SQ01", "SH010",
+                                             "animation", "caches", "alembic"))
+
+    print(f"{len(FORMATS)} formats, {export_ms} ms per export")
+    for label, workers in (("main thread", 0), ("batch workers", 3)):
+        elapsed, report, partial = publish(save_system, workers)
+        versions = sorted({result.job.version for result in report.results})
+        print(f"{label:<14}: {elapsed * 1000:8.1f} ms  version {versions}  "
+              f"partial files seen: {sorted(partial) or 'none'}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
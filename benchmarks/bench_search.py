@@ -0,0 +1,82 @@
+"""Query latency of the project search index.
+
+Run from the repository root:  python -m benchmarks.bench_search [file count]
+
+The project is built in a MemoryStorage (500k files by default).  Prints the
+build time, the latency of a set of typical queries with and without
+filters, and the cost of an incremental update after a publish.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_project import make_project
+from pipeline_core.file_index import ProjectFileIndex
+from pipeline_core.search_index import SearchIndex
+from pipeline_core.storage import MemoryStorage
+
+TARGET_MS = 10.0
+
+QUERIES = [
+    ("s", {}),
+    ("sh0", {}),
+    ("char", {}),
+    ("animation", {}),
+    ("sh1230_animation", {}),
+    ("v007", {}),
+    ("anim", {"kind": "publish", "file_format": "abc", "shot": "SH120"}),
+    ("layout", {"min_version": 3, "max_version": 5}),
+    ("prop", {"asset_type": "prop", "kind": "wip"}),
+    ("nothing_matches_this", {}),
+]
+
+
+def build(file_count):
+    storage = MemoryStorage()
+    sequences = max(1, file_count // (80 * 250))
+    shots = max(1, file_count // (80 * sequences))
+    root = make_project(sequences=sequences, shots=shots, versions=10, characters=50, storage=storage)
+    index = ProjectFileIndex(root, index_path=os.path.join(tempfile.gettempdir(), "bench_search_index.json"),
+                             storage=storage)
+    index.save = lambda: None
+    index.refresh()
+    return storage, root, index
+
+
+def time_query(search_index, text, filters, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = search_index.search(text, **filters)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(hits)
+
+
+def main(file_count=500000):
+    storage, root, index = build(file_count)
+    start = time.perf_counter()
+    search_index = SearchIndex(root)
+    search_index.update(index)
+    print(f"{len(search_index)} files indexed in {time.perf_counter() - start:.2f} s")
+
+    worst = 0.0
+    for text, filters in QUERIES:
+        seconds, count = time_query(search_index, text, filters)
+        worst = max(worst, seconds)
+        print(f"{text!r:<24} {str(filters):<56} {seconds * 1000:7.2f} ms  {count} hits")
+
+    folder = os.path.join(root, "publish", "sequence", "SQ01", "SH010", "animation", "caches", "alembic")
+    storage.add_file(os.path.join(folder, "SH010_animation_animation_v011.abc"))
+    index.refresh()
+    start = time.perf_counter()
+    search_index.update(index)
+    update_seconds = time.perf_counter() - start
+    seconds, count = time_query(search_index, "animation_v011", {})
+    print(f"incremental update {update_seconds * 1000:.2f} ms, new file found: {count == 1}")
+    print(f"slowest query {worst * 1000:.2f} ms ({'within' if worst * 1000 <= TARGET_MS else 'over'} {TARGET_MS:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
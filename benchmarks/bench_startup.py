@@ -0,0 +1,72 @@
+"""Startup time of the tools against the stubbed maya module.
+
+For each tool this measures, in a fresh interpreter: importing the
+pipeline_tools package, the first show (module import plus window build,
+up to the showWindow call, i.e. time to first paint), a second show (the
+cached window is re-shown) and a forced rebuild.
+
+Run from the repository root:  python -m benchmarks.bench_startup
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+TOOLS = ("show_file_open", "show_save_tool", "show_scene_builder")
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from benchmarks import maya_stub
+cmds = maya_stub.install(workspace=sys.argv[2])
+if sys.argv[1] == "show_scene_builder":
+    from PySide2 import QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+stub_time = time.perf_counter() - start
+
+start = time.perf_counter()
+import pipeline_tools
+package_time = time.perf_counter() - start
+
+show = getattr(pipeline_tools, sys.argv[1])
+start = time.perf_counter()
+show()
+first_time = time.perf_counter() - start
+
+start = time.perf_counter()
+show()
+second_time = time.perf_counter() - start
+
+start = time.perf_counter()
+show(rebuild=True)
+rebuild_time = time.perf_counter() - start
+
+print(json.dumps({"stub": stub_time, "package": package_time, "first": first_time,
+                  "second": second_time, "rebuild": rebuild_time, "calls": len(cmds.calls)}))
+"""
+
+
+def measure(tool, workspace):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run([sys.executable, "-c", _CHILD, tool, workspace], cwd=root,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    workspace = os.getcwd()
+    for tool in TOOLS:
+        if tool == "show_scene_builder" and importlib.util.find_spec("PySide2") is None:
+            print(f"{tool:<20} skipped (PySide2 is not installed)")
+            continue
+        times = measure(tool, workspace)
+        print(f"{tool:<20} import package {times['package'] * 1000:7.2f} ms  "
+              f"first show {times['first'] * 1000:7.2f} ms  re-show {times['second'] * 1000:7.3f} ms  "
+              f"rebuild {times['rebuild'] * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Scan scaling on the in-memory storage backend, plain and batched.
+
+Run from the repository root:  python -m benchmarks.bench_storage [file counts...]
+
+Each project is built in a MemoryStorage, so a million files need no disk.
+The cold and warm file index refreshes are timed without latency.  The same
+cold refresh is then repeated with a simulated per-call latency against the
+plain and the batched backend, counting round trips.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_project import make_project
+from pipeline_core.file_index import ProjectFileIndex
+from pipeline_core.storage import BatchedStorage, MemoryStorage
+
+VERSIONS = 10
+FILES_PER_SHOT = VERSIONS * 4 * 2  # four asset types, publish and wip
+LATENCY = 0.0002
+LATENCY_FILE_COUNT = 20000
+
+
+def build(file_count):
+    storage = MemoryStorage()
+    sequences = max(1, file_count // (FILES_PER_SHOT * 250))
+    shots = max(1, file_count // (FILES_PER_SHOT * sequences))
+    root = make_project(sequences=sequences, shots=shots, versions=VERSIONS, characters=0, storage=storage)
+    return storage, root
+
+
+def refresh(storage, root):
+    index = ProjectFileIndex(root, index_path=os.path.join(tempfile.gettempdir(), "bench_storage_index.json"),
+                             storage=storage)
+    index.save = lambda: None
+    start = time.perf_counter()
+    index.refresh()
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    index.refresh()
+    return index, cold, time.perf_counter() - start
+
+
+def main(sizes=(10000, 100000, 1000000)):
+    for size in sizes:
+        storage, root = build(size)
+        index, cold, warm = refresh(storage, root)
+        print(f"{storage.file_count():>8} files  cold refresh {cold * 1000:9.1f} ms  "
+              f"warm refresh {warm * 1000:8.1f} ms  {len(index.directories)} folders")
+
+    storage, root = build(LATENCY_FILE_COUNT)
+    storage.latency = LATENCY
+    for label, backend in (("plain", storage),
+                           ("batched", BatchedStorage(storage, [os.path.join(root, "publish"),
+                                                                os.path.join(root, "wip")]))):
+        storage.calls.clear()
+        index, cold, warm = refresh(backend, root)
+        calls = sum(storage.calls.values())
+        print(f"{label:>8} backend, {LATENCY * 1000:.1f} ms per call: cold refresh {cold * 1000:9.1f} ms, "
+              f"{calls} calls ({dict(storage.calls)})")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (10000, 100000, 1000000))
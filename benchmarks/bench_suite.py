@@ -0,0 +1,253 @@
+"""Timed scenarios for the three tools on a synthetic project, with regression checks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_suite --output results.json
+    python -m benchmarks.bench_suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_suite --baseline benchmarks/baseline.json
+
+A project is generated on disk (see --sequences, --shots, --versions,
+--characters and --asset-types) and maya is replaced by the recording stub,
+so no Maya is needed.  Each scenario runs --repeat times, after an untimed
+setup that puts the caches into the state the scenario is named after:
+
+    list_asset_files      the open tool's asset menu, until the file menu is filled
+    find_latest_version   the save tool's next-version lookup
+    save_file             a publish of mb + abc into a shot's animation folder
+    update_asset_types    Scene Builder resolving a shot's latest assets
+    load_assets           Scene Builder referencing a shot's assets into the scene
+
+Scene Builder's handlers are Qt methods, so its two scenarios time the
+pipeline_core calls those handlers make; the Qt side needs PySide2.
+
+Results are JSON: the median and best time of every scenario and how many
+maya.cmds calls one run made.  Against a baseline, a scenario regresses when
+its median is more than --tolerance slower (and at least --min-delta ms
+slower), or when it makes more cmds calls than it did.  Any regression
+makes the exit status 1.
+"""
+import argparse
+import contextlib
+import io
+import os
+import platform
+import queue
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks import maya_stub
+from benchmarks.synthetic_project import ASSET_TYPES, count_files, make_project
+from pipeline_core.jsonfile import read_json, write_json
+
+RESULTS_FORMAT = 1
+EXPORT_SIZE = 64 * 1024
+
+
+class Scenario:
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+class Suite:
+    """The project, the stub and the tool state the scenarios share."""
+
+    def __init__(self, root, cmds):
+        # Imported here: maya.cmds has to be the stub before the tools are loaded
+        from pipeline_core import async_scan, project_model
+        from pipeline_core.save_system import ArtistsTimeSortingSaveSystem
+        from pipeline_tools import file_open
+
+        self.root = root
+        self.cmds = cmds
+        self.file_open = file_open
+        self.project_model = project_model
+        self.save_system_class = ArtistsTimeSortingSaveSystem
+
+        # Results come back through this queue, which the suite drains like Maya's main loop
+        self.main_loop = queue.Queue()
+        async_scan._service = async_scan.ScanService(deliver=self.main_loop.put)
+        # The open tool's file menu, without building the rest of its window
+        cmds.optionMenu("file", label="Files")
+
+        self.sequence = "SQ01"
+        self.shot = "SH010"
+        self.shot_path = os.path.join(root, "publish", "sequence", self.sequence, self.shot)
+        self.export_path = os.path.join(self.shot_path, "animation", "caches", "alembic")
+        self.save_system = None
+
+    # list_asset_files
+
+    def reset_model(self):
+        self.project_model._model = None
+        from pipeline_core.file_index import INDEX_FILE_NAME
+        index_path = os.path.join(self.root, INDEX_FILE_NAME)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    def list_asset_files(self):
+        self.file_open.listAssetFiles("file", "char007")
+        self.main_loop.get(timeout=60)()
+        if not self.cmds.menu_contents("file"):
+            raise RuntimeError("listAssetFiles filled no files")
+
+    # find_latest_version / save_file
+
+    def new_save_system(self):
+        self.save_system = self.save_system_class()
+        self.save_system.set_project_path(self.root)
+        self.save_system.set_export_path(self.export_path)
+
+    def find_latest_version(self):
+        base_name = self.save_system.generate_file_name("hero", "abc")
+        return self.save_system.find_latest_version(base_name, "abc")
+
+    def save_file(self):
+        message = self.save_system.save_file("hero", ["mb", "abc"])
+        if not message.startswith("Files saved"):
+            raise RuntimeError(message)
+
+    # update_asset_types / load_assets
+
+    def drop_shot_manifest(self):
+        from pipeline_core.shot_manifest import SHOT_MANIFEST_NAME
+        manifest_path = os.path.join(self.shot_path, SHOT_MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+    def update_asset_types(self):
+        from pipeline_core.shot_manifest import resolve_shot
+        assets = resolve_shot(self.shot_path)
+        return [f"{asset_type} - {latest.name}" for asset_type, (folder, latest) in assets.items() if latest]
+
+    def load_assets(self):
+        from pipeline_core.assembly import assemble_references
+        from pipeline_core.shot_builder import shot_references
+        timings = assemble_references(shot_references(self.root, self.sequence, self.shot))
+        errors = [timing.error for timing in timings if timing.error]
+        if errors:
+            raise RuntimeError(errors[0])
+
+    def clear_references(self):
+        self.cmds.references.clear()
+
+    def scenarios(self):
+        return [
+            Scenario("list_asset_files.cold", self.list_asset_files, self.reset_model),
+            Scenario("list_asset_files.warm", self.list_asset_files),
+            Scenario("find_latest_version.cold", self.find_latest_version, self.new_save_system),
+            Scenario("find_latest_version.warm", self.find_latest_version),
+            Scenario("save_file", self.save_file),
+            Scenario("update_asset_types.cold", self.update_asset_types, self.drop_shot_manifest),
+            Scenario("update_asset_types.warm", self.update_asset_types),
+            Scenario("load_assets", self.load_assets, self.clear_references),
+        ]
+
+
+def run_scenario(suite, scenario, repeat):
+    times = []
+    calls = 0
+    for _ in range(repeat):
+        # The tools print as they go; keep that out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            if scenario.setup is not None:
+                scenario.setup()
+            calls_before = len(suite.cmds.calls)
+            start = time.perf_counter()
+            scenario.run()
+            times.append(time.perf_counter() - start)
+            calls = len(suite.cmds.calls) - calls_before
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "best_ms": min(times) * 1000,
+        "runs": repeat,
+        "cmds_calls": calls,
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """[(scenario, message)] for every scenario that got slower or chattier than the baseline."""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        slower = result["median_ms"] - previous["median_ms"]
+        if slower > min_delta_ms and result["median_ms"] > previous["median_ms"] * (1 + tolerance):
+            regressions.append((name, f"median {previous['median_ms']:.2f} -> {result['median_ms']:.2f} ms"))
+        if result["cmds_calls"] > previous["cmds_calls"]:
+            regressions.append((name, f"cmds calls {previous['cmds_calls']} -> {result['cmds_calls']}"))
+    return regressions
+
+
+def run_suite(sequences=2, shots=10, versions=20, characters=50, asset_types=None, repeat=5):
+    root = tempfile.mkdtemp(prefix="group3_bench_")
+    cmds = maya_stub.install(workspace=root, selection=["char_grp"], export_size=EXPORT_SIZE)
+    try:
+        make_project(root, sequences=sequences, shots=shots, versions=versions, characters=characters,
+                     asset_types=asset_types)
+        file_count = count_files(root)
+        suite = Suite(root, cmds)
+        scenarios = {}
+        for scenario in suite.scenarios():
+            scenarios[scenario.name] = run_scenario(suite, scenario, repeat)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return {
+        "format": RESULTS_FORMAT,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "project": {"sequences": sequences, "shots": shots, "versions": versions, "characters": characters,
+                    "asset_types": list(asset_types or ASSET_TYPES), "files": file_count},
+        "scenarios": scenarios,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the pipeline tools on a synthetic project.")
+    parser.add_argument("--sequences", type=int, default=2)
+    parser.add_argument("--shots", type=int, default=10)
+    parser.add_argument("--versions", type=int, default=20)
+    parser.add_argument("--characters", type=int, default=50)
+    parser.add_argument("--asset-types", nargs="+", choices=sorted(ASSET_TYPES), help="defaults to all of them")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="flag regressions against this results file")
+    parser.add_argument("--save-baseline", help="write the results to this file as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--min-delta", type=float, default=1.0, help="ignore slowdowns under this many ms")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sequences, args.shots, args.versions, args.characters, args.asset_types, args.repeat)
+    print(f"{results['project']['files']} files, {args.repeat} runs per scenario")
+    for name, result in results["scenarios"].items():
+        print(f"{name:<26} median {result['median_ms']:9.2f} ms  best {result['best_ms']:9.2f} ms  "
+              f"{result['cmds_calls']:5d} cmds calls")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            write_json(path, results)
+
+    if not args.baseline:
+        return 0
+    baseline = read_json(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}")
+        return 1
+    if baseline.get("project") != results["project"]:
+        print("Warning: the baseline was recorded on a different project; times may not compare")
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    for name, message in regressions:
+        print(f"REGRESSION {name}: {message}")
+    if not regressions:
+        print(f"No regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Benchmark and sanity check for pipeline_core.versions.
+
+Compares the old "sorted(names)[-1]" latest pick with the numeric-aware
+engine on a folder with versions past v999 and mixed asset prefixes.
+
+Run from the repository root:  python -m benchmarks.bench_versions [assets] [versions]
+"""
+import sys
+import time
+
+from pipeline_core.scan import FileRecord
+from pipeline_core.versions import VersionIndex, latest_record, parse_version
+
+
+def make_records(assets, versions):
+    records = []
+    for a in range(assets):
+        for v in range(1, versions + 1):
+            name = f"SH010_char{a:03d}_animation_v{v:03d}.abc"
+            records.append(FileRecord(name, "/publish/" + name, "publish", 0, float(v), parse_version(name)))
+    return records
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(assets=50, versions=1200):
+    records = make_records(assets, versions)
+    print(f"{len(records)} files, {assets} assets, up to v{versions}")
+
+    old_time, old_latest = timed(lambda: sorted(record.name for record in records)[-1])
+    new_time, new_latest = timed(latest_record, records)
+    print(f"sorted()[-1]         : {old_time * 1000:8.2f} ms -> {old_latest}")
+    print(f"latest_record        : {new_time * 1000:8.2f} ms -> {new_latest.name}")
+
+    build_time, index = timed(VersionIndex.from_records, records)
+    print(f"VersionIndex build   : {build_time * 1000:8.2f} ms ({len(index.assets())} assets)")
+
+    key = ("SH010_char007_animation", "abc")
+    start = time.perf_counter()
+    for _ in range(10000):
+        index.latest(key)
+        index.previous(key, versions // 2)
+        index.rollback(key, 3)
+    lookup_time = (time.perf_counter() - start) / 10000
+    print(f"latest/previous/rollback: {lookup_time * 1e6:6.2f} us per triple")
+    print(f"latest {index.latest(key).name}, rollback 3 -> {index.rollback(key, 3).name}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
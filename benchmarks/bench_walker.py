@@ -0,0 +1,66 @@
+"""Benchmark pipeline_core.scan.walk_files against the old double rglob scan.
+
+Run from the repository root:  python -m benchmarks.bench_walker [file counts...]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pipeline_core.scan import walk_files
+
+
+def make_flat_tree(file_count, files_per_folder=100):
+    root = tempfile.mkdtemp(prefix="group3_walk_")
+    for i in range(file_count):
+        folder = os.path.join(root, f"shot{i // files_per_folder:04d}", "caches")
+        if i % files_per_folder == 0:
+            os.makedirs(folder)
+        asset = "char" if i % 2 else "prop"
+        with open(os.path.join(folder, f"{asset}{i % 50:02d}_anim_v{i % 100 + 1:03d}.abc"), "w"):
+            pass
+    return root
+
+
+def old_scan(root, pattern):
+    # find_files_in_subdirectories called once for names and once for paths
+    names = [path.name for path in Path(root).rglob(pattern)]
+    paths = [str(path) for path in Path(root).rglob(pattern)]
+    return dict(zip(names, paths))
+
+
+def new_scan(root, pattern):
+    return {record.name: record.path for record in walk_files(root, "publish", pattern)}
+
+
+def first_match(root, pattern):
+    return next(walk_files(root, "publish", pattern), None)
+
+
+def timed(func, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(sizes=(10000, 100000)):
+    for size in sizes:
+        root = make_flat_tree(size)
+        try:
+            old = timed(old_scan, root, "char*")
+            new = timed(new_scan, root, "char*")
+            first = timed(first_match, root, "char*")
+            print(f"{size:>7} files  old rglob x2: {old * 1000:9.2f} ms  "
+                  f"walk_files: {new * 1000:9.2f} ms  first match: {first * 1000:7.3f} ms")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (10000, 100000))
@@ -0,0 +1,216 @@
+"""A stand-in for the maya package so the tools can be imported and timed outside Maya.
+
+install() puts maya, maya.cmds, maya.utils and maya.standalone into
+sys.modules.  The cmds stub records every call in cmds.calls; commands it
+doesn't know return None.  optionMenus and their menuItems keep real state,
+and with export_size set the save and export commands write a file of that
+many bytes, so publish code has something to digest.
+"""
+import os
+import sys
+import time
+import types
+
+
+class CmdsStub(types.ModuleType):
+    def __init__(self, workspace="", selection=None, export_size=None):
+        super(CmdsStub, self).__init__("maya.cmds")
+        self.calls = []
+        self.windows = set()
+        self.menus = {}  # optionMenu -> [menuItem names]
+        self.menu_values = {}
+        self.menu_item_labels = {}
+        self.playback_range = (1.0, 120.0)
+        self.export_size = export_size
+        self.option_vars = {}
+        self.workspace_root = workspace
+        self.selection = list(selection or [])
+        self.scene_name = ""
+        self.references = {}
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def command(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return None
+        return command
+
+    def _record(self, name, args, kwargs):
+        self.calls.append((name, args, kwargs))
+
+    def window(self, name=None, **kwargs):
+        self._record("window", (name,), kwargs)
+        if kwargs.get("exists"):
+            return name in self.windows
+        self.windows.add(name)
+        return name
+
+    def deleteUI(self, name, **kwargs):
+        self._record("deleteUI", (name,), kwargs)
+        self.windows.discard(name)
+        if name in self.menu_item_labels:
+            label = self.menu_item_labels.pop(name)
+            for menu, items in self.menus.items():
+                if name in items:
+                    items.remove(name)
+                    # Like Maya, deleting the selected item moves the selection to the first one
+                    if self.menu_values.get(menu) == label:
+                        del self.menu_values[menu]
+
+    def optionMenu(self, name=None, **kwargs):
+        self._record("optionMenu", (name,), kwargs)
+        if kwargs.get("exists"):
+            return name in self.menus
+        items = self.menus.setdefault(name, [])
+        if kwargs.get("query"):
+            if kwargs.get("itemListLong"):
+                return list(items)
+            if kwargs.get("value"):
+                return self.menu_values.get(name, self.menu_item_labels[items[0]] if items else None)
+            return None
+        if kwargs.get("edit") and "value" in kwargs:
+            self.menu_values[name] = kwargs["value"]
+        return name
+
+    def menuItem(self, name=None, **kwargs):
+        self._record("menuItem", (name,), kwargs)
+        if kwargs.get("query"):
+            return self.menu_item_labels.get(name)
+        name = f"menuItem{len(self.calls)}"
+        self.menu_item_labels[name] = kwargs.get("label", "")
+        items = self.menus.get(kwargs.get("parent"))
+        if items is not None:
+            after = kwargs.get("insertAfter")
+            if after is None:
+                items.append(name)
+            else:
+                items.insert(items.index(after) + 1 if after else 0, name)
+        return name
+
+    def menu_contents(self, name):
+        """The labels optionMenu name currently shows."""
+        return [self.menu_item_labels[item] for item in self.menus.get(name, [])]
+
+    def playbackOptions(self, **kwargs):
+        self._record("playbackOptions", (), kwargs)
+        if kwargs.get("minTime"):
+            return self.playback_range[0]
+        if kwargs.get("maxTime"):
+            return self.playback_range[1]
+        return None
+
+    def _write_export(self, path):
+        if self.export_size is not None and path:
+            with open(path, "wb") as handle:
+                handle.write(os.urandom(self.export_size))
+
+    def AbcExport(self, **kwargs):
+        self._record("AbcExport", (), kwargs)
+        job = kwargs.get("j") or kwargs.get("jobArg") or ""
+        words = job.split()
+        if "-file" in words:
+            self._write_export(words[words.index("-file") + 1])
+
+    def workspace(self, *args, **kwargs):
+        self._record("workspace", args, kwargs)
+        if "expandName" in kwargs:
+            return os.path.join(self.workspace_root, kwargs["expandName"].replace("\\", os.sep))
+        return self.workspace_root
+
+    def optionVar(self, **kwargs):
+        self._record("optionVar", (), kwargs)
+        if "stringValue" in kwargs:
+            key, value = kwargs["stringValue"]
+            self.option_vars[key] = value
+        elif "query" in kwargs:
+            return self.option_vars.get(kwargs["query"])
+
+    def ls(self, *args, **kwargs):
+        self._record("ls", args, kwargs)
+        if kwargs.get("selection"):
+            return list(self.selection)
+        return []
+
+    def select(self, *args, **kwargs):
+        self._record("select", args, kwargs)
+        if args:
+            nodes = args[0]
+            self.selection = list(nodes) if isinstance(nodes, (list, tuple)) else [nodes]
+
+    def file(self, *args, **kwargs):
+        self._record("file", args, kwargs)
+        if kwargs.get("query") and kwargs.get("sceneName"):
+            return self.scene_name
+        if "rename" in kwargs:
+            self.scene_name = kwargs["rename"]
+        if kwargs.get("save"):
+            self._write_export(self.scene_name)
+        if (kwargs.get("es") or kwargs.get("exportSelected") or kwargs.get("exportAll")) and args:
+            self._write_export(args[0])
+        if kwargs.get("reference") and args:
+            self.references[f"{kwargs.get('namespace', 'ref')}RN"] = args[0]
+            return args[0]
+        return None
+
+    def referenceQuery(self, target, **kwargs):
+        self._record("referenceQuery", (target,), kwargs)
+        if kwargs.get("referenceNode"):
+            for node, path in self.references.items():
+                if path == target:
+                    return node
+        if kwargs.get("namespace"):
+            return ":" + target[:-2]
+        return None
+
+    def undoInfo(self, *args, **kwargs):
+        self._record("undoInfo", args, kwargs)
+        return True if kwargs.get("query") else None
+
+    def calls_to(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+
+def install(workspace="", selection=None, export_size=None):
+    """Install the stub into sys.modules and return the cmds stub."""
+    maya = types.ModuleType("maya")
+    cmds = CmdsStub(workspace, selection, export_size)
+    utils = types.ModuleType("maya.utils")
+    utils.executeDeferred = lambda func, *args: func(*args)
+    standalone = types.ModuleType("maya.standalone")
+    standalone.initialize = lambda name=None: None
+    standalone.uninitialize = lambda: None
+    maya.cmds = cmds
+    maya.utils = utils
+    maya.standalone = standalone
+    sys.modules.update({"maya": maya, "maya.cmds": cmds, "maya.utils": utils, "maya.standalone": standalone})
+    return cmds
+
+
+class SlowCommand:
+    """Wrap a stub command so calls sleep first, to mimic a slow export.
+
+    With when given, only calls for which when(*args, **kwargs) is true sleep.
+    """
+
+    def __init__(self, func, seconds, when=None):
+        self.func = func
+        self.seconds = seconds
+        self.when = when
+
+    def __call__(self, *args, **kwargs):
+        if self.when is None or self.when(*args, **kwargs):
+            time.sleep(self.seconds)
+        return self.func(*args, **kwargs)
+
+
+def is_export(*args, **kwargs):
+    """True for the cmds.file calls that write a scene or an export."""
+    return any(kwargs.get(flag) for flag in ("save", "es", "exportSelected", "exportAll"))
+
+
+def slow_exports(cmds, seconds):
+    """Make cmds' AbcExport and exporting file calls take seconds each."""
+    cmds.AbcExport = SlowCommand(cmds.AbcExport, seconds)
+    cmds.file = SlowCommand(cmds.file, seconds, when=is_export)
@@ -0,0 +1,52 @@
+"""Builds throwaway project trees shaped like the Group 3 publish/wip layout."""
+import os
+import tempfile
+
+ASSET_TYPES = {
+    "set": ("set", "source", "mb"),
+    "layout": ("layout", "caches", "fbx", "fbx"),
+    "animation": ("animation", "caches", "alembic", "abc"),
+    "prop": ("prop", "caches", "alembic", "abc"),
+}
+
+
+def _touch(path):
+    with open(path, "w"):
+        pass
+
+
+def make_project(root=None, sequences=2, shots=5, versions=10, characters=20, storage=None, asset_types=None):
+    """Create a synthetic project and return its root folder.
+
+    asset_types picks which of ASSET_TYPES every shot gets (all by default).
+    With a MemoryStorage the files are only added to it, so projects of a
+    million files cost memory instead of disk.
+    """
+    if storage is not None:
+        root = root or os.path.join(os.sep, "memory_project")
+        makedirs, touch = storage.makedirs, storage.add_file
+    else:
+        root = root or tempfile.mkdtemp(prefix="group3_project_")
+        makedirs, touch = (lambda folder: os.makedirs(folder, exist_ok=True)), _touch
+    for kind in ("publish", "wip"):
+        for s in range(sequences):
+            seq = f"SQ{s + 1:02d}"
+            for h in range(shots):
+                shot = f"SH{(h + 1) * 10:03d}"
+                for asset_type in asset_types or ASSET_TYPES:
+                    parts = ASSET_TYPES[asset_type]
+                    folder = os.path.join(root, kind, "sequence", seq, shot, *parts[:-1])
+                    makedirs(folder)
+                    for v in range(versions):
+                        touch(os.path.join(folder, f"{shot}_{asset_type}_{parts[0]}_v{v + 1:03d}.{parts[-1]}"))
+        for c in range(characters):
+            name = f"char{c:03d}"
+            folder = os.path.join(root, kind, "assets", "character", name, "model", "source")
+            makedirs(folder)
+            for v in range(versions):
+                touch(os.path.join(folder, f"{name}_model_v{v + 1:03d}.mb"))
+    return root
+
+
+def count_files(root):
+    return sum(len(files) for _, _, files in os.walk(root))
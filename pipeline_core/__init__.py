@@ -0,0 +1 @@
+"""Shared, UI-free helpers used by the Group 3 pipeline tools."""
@@ -0,0 +1,137 @@
+"""Split an Alembic publish into per-root / per-frame-chunk jobs for mayapy workers.
+
+Each part exports some of the roots over some of the frames.  Frame chunks
+of a root are joined with AbcStitcher, and when the roots were split the
+per-root caches are merged into the published file by one more mayapy job.
+Parts are written to a work folder keyed on the snapshot, and finished
+parts are recorded in progress.json there, so a publish that is retried
+after a worker died only exports the parts that are missing.  Work folders
+of publishes that were never retried are removed after WORK_FOLDER_DAYS.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_core import instrumentation
+from pipeline_core.jsonfile import locked_update, read_json
+from pipeline_core.mayapy import find_abc_stitcher, run_tool
+
+WORK_ROOT = os.path.join(tempfile.gettempdir(), "pipeline_abc_parts")
+PROGRESS_NAME = "progress.json"
+PART_ATTEMPTS = 2
+WORK_FOLDER_DAYS = 3
+
+AlembicPart = namedtuple("AlembicPart", ["name", "roots", "frame_range"])
+
+
+def frame_chunks(frame_range, chunk_frames):
+    start, end = frame_range
+    if not chunk_frames or end - start + 1 <= chunk_frames:
+        return [(start, end)]
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + chunk_frames - 1, end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + 1
+    return chunks
+
+
+def plan_parts(roots, frame_range, per_root=False, chunk_frames=0):
+    """AlembicParts covering every root over frame_range."""
+    root_groups = [[root] for root in roots] if per_root else [list(roots)]
+    parts = []
+    for group_number, group in enumerate(root_groups):
+        for chunk_number, chunk in enumerate(frame_chunks(frame_range, chunk_frames)):
+            parts.append(AlembicPart(f"r{group_number:03d}_c{chunk_number:03d}", group, chunk))
+    return parts
+
+
+def work_folder(resume_key):
+    return os.path.join(WORK_ROOT, hashlib.sha1(resume_key.encode("utf-8")).hexdigest()[:16])
+
+
+def sweep_work_folders(keep=None):
+    """Remove work folders untouched for WORK_FOLDER_DAYS, other than keep."""
+    cutoff = time.time() - WORK_FOLDER_DAYS * 24 * 3600
+    try:
+        names = os.listdir(WORK_ROOT)
+    except OSError:
+        return
+    for name in names:
+        folder = os.path.join(WORK_ROOT, name)
+        try:
+            if folder != keep and os.path.getmtime(folder) < cutoff:
+                shutil.rmtree(folder)
+        except OSError:
+            pass
+
+
+def _mark_done(folder, part_name):
+    locked_update(os.path.join(folder, PROGRESS_NAME),
+                  lambda progress: progress["done"].append(part_name), lambda: {"done": []})
+
+
+def _export_part(part, folder, scene_path, mayapy):
+    part_path = os.path.join(folder, part.name + ".abc")
+    start, end = part.frame_range
+    command = [mayapy, "-m", "pipeline_core.batch_export", scene_path, "abc", part_path,
+               str(start), str(end)] + list(part.roots)
+    for attempt in range(PART_ATTEMPTS):
+        try:
+            with instrumentation.measure("alembic_part", part.name) as span:
+                run_tool(command)
+                span.files = 1
+                span.bytes = os.path.getsize(part_path)
+            break
+        except (RuntimeError, OSError):
+            if attempt == PART_ATTEMPTS - 1:
+                raise
+    _mark_done(folder, part.name)
+    return part_path
+
+
+def export_chunked(file_path, snapshot, scene_path, mayapy, workers, resume_key, per_root=False, chunk_frames=0):
+    """Export snapshot's roots to file_path as parallel parts and join them."""
+    stitcher = find_abc_stitcher(mayapy)
+    if chunk_frames and stitcher is None:
+        print("AbcStitcher was not found next to mayapy; exporting whole frame ranges")
+        chunk_frames = 0
+    parts = plan_parts(snapshot.nodes, snapshot.frame_range, per_root, chunk_frames)
+
+    folder = work_folder(json.dumps([resume_key, [list(part) for part in parts]]))
+    sweep_work_folders(keep=folder)
+    os.makedirs(folder, exist_ok=True)
+    done = set(read_json(os.path.join(folder, PROGRESS_NAME), {"done": []})["done"])
+    paths = {part.name: os.path.join(folder, part.name + ".abc") for part in parts}
+    missing = [part for part in parts if part.name not in done or not os.path.exists(paths[part.name])]
+    if len(missing) < len(parts):
+        print(f"Resuming Alembic export: {len(parts) - len(missing)} of {len(parts)} parts already done")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missing) or 1))) as pool:
+        for future in [pool.submit(_export_part, part, folder, scene_path, mayapy) for part in missing]:
+            future.result()
+
+    # Join frame chunks per root group, then merge the root groups
+    group_paths = []
+    for group in sorted({part.name.split("_")[0] for part in parts}):
+        chunk_paths = [paths[part.name] for part in parts if part.name.startswith(group + "_")]
+        if len(chunk_paths) == 1:
+            group_paths.append(chunk_paths[0])
+            continue
+        group_path = os.path.join(folder, group + ".abc")
+        # AbcStitcher outFile.abc inFile1.abc inFile2.abc ...
+        run_tool([stitcher, group_path] + chunk_paths)
+        group_paths.append(group_path)
+
+    if len(group_paths) == 1:
+        shutil.copyfile(group_paths[0], file_path)
+    else:
+        start, end = snapshot.frame_range
+        run_tool([mayapy, "-m", "pipeline_core.batch_export", "merge", file_path, str(start), str(end)] + group_paths)
+    shutil.rmtree(folder, ignore_errors=True)
@@ -0,0 +1,119 @@
+"""Bulk scene assembly: create every reference unloaded, then load them together.
+
+Viewport refresh and undo recording are suspended for the whole assembly so
+Maya does not redraw or record after each reference.  Every reference gets a
+ReferenceTiming so slow caches are easy to spot.  With proxy_first, a cache
+that has a lightweight copy in a "proxy" folder next to it is loaded as the
+proxy first and swapped to the full cache once everything is in the scene.
+localize, when given, maps each full cache to the path actually
+referenced, e.g. a copy in the local cache.
+"""
+import os
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+import maya.cmds as cmds
+
+from pipeline_core import instrumentation
+
+PROXY_FOLDER = "proxy"
+
+ReferenceTiming = namedtuple("ReferenceTiming", ["namespace", "path", "create_seconds", "load_seconds", "error"])
+
+
+def find_proxy(path):
+    proxy = os.path.join(os.path.dirname(path), PROXY_FOLDER, os.path.basename(path))
+    return proxy if os.path.exists(proxy) else None
+
+
+@contextmanager
+def suspended_scene_updates():
+    undo_enabled = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undo_enabled)
+        cmds.refresh(suspend=False)
+        cmds.refresh(force=True)
+
+
+def _swap_to_full(reference_node, path, localize=None):
+    try:
+        if localize is not None:
+            path = localize(path)
+        cmds.file(path, loadReference=reference_node)
+        print(f"Swapped {reference_node} to full cache {path}")
+    except Exception as e:
+        cmds.warning(f"Failed to swap {reference_node} to {path}: {e}")
+
+
+def assemble_references(requests, proxy_first=False, localize=None):
+    """Reference every (namespace, path) in requests and return a ReferenceTiming per request."""
+    created = []
+    timings = {}
+    with suspended_scene_updates():
+        for namespace, path in requests:
+            load_path = (find_proxy(path) or path) if proxy_first else path
+            if localize is not None and load_path == path:
+                path = load_path = localize(path)
+            start = time.perf_counter()
+            try:
+                reference_file = cmds.file(load_path, reference=True, deferReference=True, namespace=namespace)
+                reference_node = cmds.referenceQuery(reference_file, referenceNode=True)
+            except Exception as e:
+                timings[namespace] = ReferenceTiming(namespace, path, time.perf_counter() - start, 0.0, str(e))
+                continue
+            created.append((namespace, path, load_path, reference_node, time.perf_counter() - start))
+
+        for namespace, path, load_path, reference_node, create_seconds in created:
+            start = time.perf_counter()
+            error = None
+            try:
+                cmds.file(loadReference=reference_node)
+            except Exception as e:
+                error = str(e)
+            timings[namespace] = ReferenceTiming(namespace, load_path, create_seconds, time.perf_counter() - start, error)
+            if instrumentation.is_enabled() and error is None:
+                size = os.path.getsize(load_path) if os.path.exists(load_path) else 0
+                instrumentation.record("reference_load", namespace, create_seconds + timings[namespace].load_seconds, 1, size)
+
+    # Full caches are swapped in from the idle queue so the proxies are usable straight away
+    swaps = [(reference_node, path) for namespace, path, load_path, reference_node, create_seconds in created
+             if load_path != path and timings[namespace].error is None]
+    if swaps:
+        import maya.utils
+        for reference_node, path in swaps:
+            maya.utils.executeDeferred(_swap_to_full, reference_node, path, localize)
+
+    return [timings[namespace] for namespace, path in requests if namespace in timings]
+
+
+def find_reference_node(namespace):
+    for node in cmds.ls(type="reference") or []:
+        if node == "sharedReferenceNode":
+            continue
+        try:
+            if cmds.referenceQuery(node, namespace=True).lstrip(":") == namespace:
+                return node
+        except RuntimeError:
+            continue
+    return None
+
+
+def swap_reference(namespace, path):
+    """Point the reference in namespace at path in place, or create it if it isn't in the scene."""
+    reference_node = find_reference_node(namespace)
+    if reference_node is None:
+        cmds.file(path, reference=True, namespace=namespace)
+        return None
+    cmds.file(path, loadReference=reference_node)
+    return reference_node
+
+
+def print_timings(timings):
+    for timing in sorted(timings, key=lambda t: t.create_seconds + t.load_seconds, reverse=True):
+        status = f"FAILED: {timing.error}" if timing.error else "ok"
+        print(f"{timing.namespace:<50} create {timing.create_seconds:6.2f}s  load {timing.load_seconds:6.2f}s  {status}")
@@ -0,0 +1,110 @@
+"""Background directory scanning shared by the pipeline tools.
+
+Filesystem work runs on a small thread pool and results are handed back to
+Maya's main thread with maya.utils.executeDeferred.  Every request belongs
+to a channel (usually the name of the menu it fills); submitting a new
+request on a channel makes any older one on that channel stale: if it
+hasn't started yet it is cancelled, so it never holds up the pool, and if
+it has, its result is dropped instead of delivered.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_core import instrumentation
+
+LOADING_LABEL = "Loading..."
+
+
+def main_thread_deliver(callback):
+    try:
+        import maya.utils
+    except ImportError:
+        callback()
+        return
+    maya.utils.executeDeferred(callback)
+
+
+class ScanService:
+    def __init__(self, max_workers=4, deliver=main_thread_deliver, history=200):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-scan")
+        self._deliver = deliver
+        self._generations = {}
+        self._futures = {}  # channel -> Future of its latest request
+        self._lock = threading.Lock()
+        # (channel, seconds from submit to delivery) of recent requests
+        self.latencies = deque(maxlen=history)
+        self.stale_count = 0
+
+    def submit(self, channel, func, *args, on_result=None, on_error=None):
+        """Run func(*args) in the pool and deliver its result on the main thread."""
+        with self._lock:
+            generation = self._generations.get(channel, 0) + 1
+            self._generations[channel] = generation
+            previous = self._futures.pop(channel, None)
+        if previous is not None:
+            previous.cancel()
+        submitted = time.perf_counter()
+
+        def finish(callback, value):
+            if not self.is_current(channel, generation):
+                self._mark_stale()
+                return
+            latency = time.perf_counter() - submitted
+            self.latencies.append((channel, latency))
+            if instrumentation.is_enabled():
+                instrumentation.record("ui_request", channel, latency, len(value) if isinstance(value, (list, dict)) else 0)
+            if callback is not None:
+                callback(value)
+
+        def done(future):
+            if future.cancelled() or not self.is_current(channel, generation):
+                self._mark_stale()
+                return
+            with self._lock:
+                if self._futures.get(channel) is future:
+                    del self._futures[channel]
+            error = future.exception()
+            if error is not None:
+                self._deliver(lambda: finish(on_error, error))
+            else:
+                result = future.result()
+                self._deliver(lambda: finish(on_result, result))
+
+        future = self._pool.submit(func, *args)
+        with self._lock:
+            if self._generations.get(channel) == generation:
+                self._futures[channel] = future
+        future.add_done_callback(done)
+        return future
+
+    def is_current(self, channel, generation):
+        with self._lock:
+            return self._generations.get(channel) == generation
+
+    def _mark_stale(self):
+        with self._lock:
+            self.stale_count += 1
+
+    def cancel(self, channel):
+        """Drop whatever is in flight on channel."""
+        with self._lock:
+            self._generations[channel] = self._generations.get(channel, 0) + 1
+            previous = self._futures.pop(channel, None)
+        if previous is not None:
+            previous.cancel()
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+
+
+_service = None
+
+
+def get_scan_service():
+    """The process-wide service, so all tools share one pool."""
+    global _service
+    if _service is None:
+        _service = ScanService()
+    return _service
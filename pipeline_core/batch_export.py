@@ -0,0 +1,52 @@
+"""mayapy entry point that exports one format from a publish snapshot scene.
+
+Usage: mayapy -m pipeline_core.batch_export <scene> <format> <output> <start> <end> <root> [<root> ...]
+       mayapy -m pipeline_core.batch_export merge <output> <start> <end> <part.abc> [<part.abc> ...]
+
+merge imports per-root Alembic parts into an empty scene and writes them
+back out as one cache; replaying caches is much cheaper than evaluating the
+rigs they came from.
+"""
+import sys
+
+from pipeline_core.mayapy import initialize_standalone, uninitialize_standalone
+
+
+def merge_alembic(file_path, start, end, parts):
+    import maya.cmds as cmds
+    cmds.file(new=True, force=True)
+    existing = set(cmds.ls(assemblies=True, long=True))
+    for part in parts:
+        cmds.AbcImport(part, mode="import")
+    roots = [node for node in cmds.ls(assemblies=True, long=True) if node not in existing]
+    root_flags = " ".join(f"-root {root}" for root in roots)
+    cmds.AbcExport(j=f"-frameRange {start} {end} -dataFormat ogawa {root_flags} -file {file_path}")
+
+
+def main(argv):
+    if argv[0] == "merge":
+        file_path, start, end = argv[1:4]
+        initialize_standalone()
+        try:
+            merge_alembic(file_path, start, end, argv[4:])
+        finally:
+            uninitialize_standalone()
+        return 0
+
+    scene_path, file_format, file_path, start, end = argv[:5]
+    nodes = argv[5:]
+
+    initialize_standalone()
+    try:
+        import maya.cmds as cmds
+        cmds.file(scene_path, open=True, force=True)
+
+        from pipeline_core.publish import PublishSnapshot, export_format
+        export_format(file_format, file_path, PublishSnapshot(nodes, (float(start), float(end)), scene_path))
+    finally:
+        uninitialize_standalone()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,107 @@
+"""Content digests of published files, and dedup of unchanged publishes.
+
+Each published file gets a "<file>.sha256" sidecar in sha256sum format.
+Files are hashed through a memory map one chunk at a time, so memory use
+stays flat however big the cache is.  When a new version hashes the same
+as the version before it, the new file is replaced by a hardlink to the
+old one, so an unchanged re-publish takes no extra space.
+"""
+import hashlib
+import mmap
+import os
+
+from pipeline_core import instrumentation
+
+DIGEST_SUFFIX = ".sha256"
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def digest_path(path):
+    return path + DIGEST_SUFFIX
+
+
+def file_digest(path, chunk_size=CHUNK_SIZE):
+    """sha256 hex digest of path, read chunk by chunk through a memory map."""
+    digest = hashlib.sha256()
+    with instrumentation.measure("checksum", path) as span, open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        span.files = 1
+        span.bytes = size
+        if size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        digest.update(view[offset:offset + chunk_size])
+                finally:
+                    view.release()
+    return digest.hexdigest()
+
+
+def read_digest(path):
+    """The digest stored next to path, or None if there is none or it is older than the file."""
+    sidecar = digest_path(path)
+    try:
+        if os.stat(sidecar).st_mtime < os.stat(path).st_mtime:
+            return None
+        with open(sidecar) as handle:
+            return handle.read().split()[0]
+    except (OSError, IndexError):
+        return None
+
+
+def write_digest(path, digest):
+    with open(digest_path(path), "w") as handle:
+        handle.write(f"{digest}  {os.path.basename(path)}\n")
+
+
+def ensure_digest(path):
+    """The stored digest of path, hashing the file and writing the sidecar if needed."""
+    digest = read_digest(path)
+    if digest is None:
+        digest = file_digest(path)
+        try:
+            write_digest(path, digest)
+        except OSError as e:
+            print(f"Could not write digest for {path}: {e}")
+    return digest
+
+
+def link_duplicate(source, duplicate):
+    """Replace duplicate with a hardlink to source. Returns False when the filesystem can't link."""
+    temp_path = duplicate + ".link"
+    try:
+        os.link(source, temp_path)
+        os.replace(temp_path, duplicate)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def dedupe_publish(path, previous_path=None):
+    """Digest a freshly exported file and hardlink it to previous_path if the content matches.
+
+    Returns (digest, linked).
+    """
+    digest = file_digest(path)
+    linked = False
+    if previous_path and os.path.exists(previous_path) and os.path.getsize(previous_path) == os.path.getsize(path):
+        if ensure_digest(previous_path) == digest:
+            linked = link_duplicate(previous_path, path)
+    write_digest(path, digest)
+    return digest, linked
+
+
+def same_content(path, other_path):
+    """True only when both files are known to hold the same bytes, using the sidecars and never hashing."""
+    try:
+        if os.path.samefile(path, other_path):
+            return True
+    except OSError:
+        return False
+    digest = read_digest(path)
+    return digest is not None and digest == read_digest(other_path)
@@ -0,0 +1,192 @@
+"""Headless batch entry point for publishing and shot assembly.
+
+    python -m pipeline_core jobs.json --workers 4 --results results.json
+
+jobs.json holds a list of jobs:
+
+    {"action": "publish", "scene": ".../SH010_anim.mb", "export_path": ".../animation/caches/alembic",
+     "description": "hero", "formats": ["abc", "fbx"], "nodes": ["char_grp"],
+     "frame_range": [1001, 1240], "split_roots": true, "chunk_frames": 60}
+    {"action": "assemble", "project": "...", "sequence": "SQ01", "shot": "SH010",
+     "output": ".../SH010_assembled.mb", "proxy_first": false, "local_cache": false}
+    {"action": "latest", "project": "...", "shots": [["SQ01", "SH010"], ["SQ01", "SH020"]]}
+
+"latest" jobs only read the publish tree, so they run in this process; a
+stale shot manifest is rescanned but not written back.
+Publish and assemble jobs are shared out across --workers mayapy processes;
+each worker starts Maya once and runs its whole share of the jobs.  With
+--workers 0 they run in this process, which then has to be mayapy itself.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_core.jsonfile import read_json, write_json
+from pipeline_core.mayapy import find_mayapy, initialize_standalone, uninitialize_standalone, worker_environment
+from pipeline_core.shot_builder import latest_versions
+
+MAYA_ACTIONS = ("publish", "assemble")
+
+
+def run_latest_job(job):
+    shots = {}
+    for sequence, shot in job["shots"]:
+        shots[f"{sequence}/{shot}"] = latest_versions(job["project"], sequence, shot, read_only=True)
+    return {"ok": True, "shots": shots}
+
+
+def run_publish_job(job):
+    import maya.cmds as cmds
+    from pipeline_core.save_system import ArtistsTimeSortingSaveSystem
+
+    cmds.file(job["scene"], open=True, force=True)
+    if job.get("nodes"):
+        cmds.select(job["nodes"], replace=True)
+    save_system = ArtistsTimeSortingSaveSystem()
+    save_system.set_export_path(job["export_path"])
+    save_system.frame_range = job.get("frame_range")
+    save_system.split_alembic_roots = job.get("split_roots", False)
+    save_system.alembic_chunk_frames = job.get("chunk_frames", 0)
+    if save_system.split_alembic_roots or save_system.alembic_chunk_frames:
+        save_system.batch_workers = job.get("workers", 2)
+    report = save_system.publish(job["description"], job["formats"])
+    return {
+        "ok": report.ok,
+        "files": [result.job.path for result in report.results if result.ok],
+        "errors": {result.job.file_format: result.error for result in report.results if not result.ok},
+    }
+
+
+def run_assemble_job(job):
+    import maya.cmds as cmds
+    from pipeline_core.local_cache import get_local_cache
+    from pipeline_core.shot_builder import assemble_shot
+
+    cmds.file(new=True, force=True)
+    localize = get_local_cache().fetch if job.get("local_cache") else None
+    timings = assemble_shot(job["project"], job["sequence"], job["shot"], proxy_first=job.get("proxy_first", False),
+                            localize=localize)
+    if localize:
+        get_local_cache().save()
+    output = job.get("output")
+    if output:
+        cmds.file(rename=output)
+        cmds.file(save=True, type="mayaAscii" if output.endswith(".ma") else "mayaBinary")
+    failed = [timing.namespace for timing in timings if timing.error]
+    return {
+        "ok": not failed,
+        "error": f"failed to load {', '.join(failed)}" if failed else None,
+        "output": output,
+        "references": [timing._asdict() for timing in timings],
+    }
+
+
+JOB_RUNNERS = {
+    "latest": run_latest_job,
+    "publish": run_publish_job,
+    "assemble": run_assemble_job,
+}
+
+
+def run_job(job):
+    start = time.perf_counter()
+    try:
+        runner = JOB_RUNNERS[job["action"]]
+        result = runner(job)
+    except Exception as e:
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    result["index"] = job.get("index")
+    result["action"] = job.get("action")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run_worker(jobs_path, results_path):
+    """Body of one mayapy worker: start Maya once and run every job in jobs_path."""
+    initialize_standalone()
+    try:
+        write_json(results_path, [run_job(job) for job in read_json(jobs_path, [])])
+    finally:
+        uninitialize_standalone()
+
+
+def _run_worker_process(mayapy, jobs, work_dir, number):
+    jobs_path = os.path.join(work_dir, f"jobs_{number}.json")
+    results_path = os.path.join(work_dir, f"results_{number}.json")
+    write_json(jobs_path, jobs)
+    command = [mayapy, "-m", "pipeline_core", "--worker", jobs_path, results_path]
+    completed = subprocess.run(command, capture_output=True, text=True, env=worker_environment())
+    results = read_json(results_path)
+    if results is None:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "worker produced no results"
+        results = [{"ok": False, "index": job["index"], "action": job["action"], "seconds": 0.0, "error": error}
+                   for job in jobs]
+    return results
+
+
+def run_jobs(jobs, workers=1, mayapy=None):
+    """Run every job and return their results in job order."""
+    jobs = [dict(job, index=i) for i, job in enumerate(jobs)]
+    maya_jobs = [job for job in jobs if job.get("action") in MAYA_ACTIONS]
+    results = [run_job(job) for job in jobs if job.get("action") not in MAYA_ACTIONS]
+
+    if maya_jobs and workers > 0:
+        mayapy = mayapy or find_mayapy()
+        if mayapy is None:
+            raise RuntimeError("mayapy was not found; set MAYAPY or pass --mayapy")
+        workers = min(workers, len(maya_jobs))
+        work_dir = tempfile.mkdtemp(prefix="pipeline_batch_")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_run_worker_process, mayapy, maya_jobs[number::workers], work_dir, number)
+                           for number in range(workers)]
+                for future in futures:
+                    results.extend(future.result())
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    elif maya_jobs:
+        initialize_standalone()
+        try:
+            results.extend(run_job(job) for job in maya_jobs)
+        finally:
+            uninitialize_standalone()
+
+    return sorted(results, key=lambda result: result["index"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pipeline_core", description="Run publish / assemble / latest jobs without the UI.")
+    parser.add_argument("jobs", nargs="?", help="JSON file with a list of jobs")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="number of mayapy worker processes (0 runs Maya jobs in this process)")
+    parser.add_argument("--mayapy", help="mayapy executable for the workers (defaults to $MAYAPY)")
+    parser.add_argument("--results", help="write the results to this JSON file")
+    parser.add_argument("--worker", nargs=2, metavar=("JOBS", "RESULTS"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(*args.worker)
+        return 0
+    if not args.jobs:
+        parser.error("a jobs file is required")
+
+    jobs = read_json(args.jobs)
+    if not isinstance(jobs, list):
+        parser.error(f"{args.jobs} does not contain a list of jobs")
+
+    results = run_jobs(jobs, workers=args.workers, mayapy=args.mayapy)
+    for result in results:
+        status = "ok" if result["ok"] else f"FAILED {result.get('error') or result.get('errors')}"
+        print(f"[{result['index']}] {result['action']:<9} {result['seconds']:7.2f}s  {status}")
+    if args.results:
+        write_json(args.results, results)
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
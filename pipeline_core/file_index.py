@@ -0,0 +1,169 @@
+"""On-disk catalog of every file under a project's publish and wip folders.
+
+The index is built once with a full walk and then kept fresh by only
+re-listing directories whose mtime changed since the last refresh, so a
+warm refresh costs one stat per directory instead of one per file.
+"""
+import bisect
+import json
+import os
+
+from pipeline_core import instrumentation
+from pipeline_core.checksum import DIGEST_SUFFIX
+from pipeline_core.jsonfile import write_json
+from pipeline_core.scan import FileRecord, parse_version
+from pipeline_core.shot_manifest import PUBLISH_MANIFEST_NAME, SHOT_MANIFEST_NAME
+from pipeline_core.storage import LinkGuard, get_storage
+
+INDEX_FILE_NAME = ".ezFileIndex.json"
+INDEX_FORMAT = 2
+# Bookkeeping files kept next to the published ones, never listed as files
+SKIPPED_NAMES = (PUBLISH_MANIFEST_NAME, SHOT_MANIFEST_NAME)
+SKIPPED_SUFFIXES = (DIGEST_SUFFIX, ".lock", ".tmp")
+
+
+def is_indexed_name(name):
+    return name not in SKIPPED_NAMES and not name.endswith(SKIPPED_SUFFIXES)
+
+
+class ProjectFileIndex:
+    def __init__(self, project_root, roots=("publish", "wip"), index_path=None, storage=None):
+        self.project_root = os.path.normpath(project_root)
+        self._storage = storage
+        self.roots = tuple(roots)
+        self.index_path = index_path or os.path.join(self.project_root, INDEX_FILE_NAME)
+        # directory path -> {"kind", "mtime", "dirs", "files": [[name, size, mtime], ...]}
+        # file size/mtime are as of the last time their directory was listed
+        self.directories = {}
+        # FileRecords sorted by name, used for prefix lookups by asset
+        self._records = []
+        self._keys = []
+        # Bumped whenever the directories change; changed_directories holds the
+        # folders the last refresh re-listed or dropped (None after a load)
+        self.generation = 0
+        self.changed_directories = set()
+
+    @property
+    def storage(self):
+        return self._storage or get_storage()
+
+    def load(self):
+        try:
+            with open(self.index_path, "r") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return False
+        if data.get("format") != INDEX_FORMAT or data.get("project_root") != self.project_root:
+            return False
+        self.directories = data.get("directories", {})
+        self.generation += 1
+        self.changed_directories = None
+        self._rebuild_lookup()
+        return True
+
+    def save(self):
+        data = {
+            "format": INDEX_FORMAT,
+            "project_root": self.project_root,
+            "directories": self.directories,
+        }
+        try:
+            write_json(self.index_path, data)
+        except OSError as e:
+            print(f"Could not write file index {self.index_path}: {e}")
+
+    def refresh(self):
+        """Bring the index up to date, re-listing only directories that changed."""
+        seen = {}
+        changed = False
+        rescanned = set()
+        with instrumentation.measure("scan", "file_index.refresh") as span:
+            for kind in self.roots:
+                stack = [os.path.join(self.project_root, kind)]
+                guard = LinkGuard(self.storage, stack[0])
+                while stack:
+                    directory = stack.pop()
+                    try:
+                        mtime = self.storage.stat(directory).mtime
+                    except OSError:
+                        continue
+                    entry = self.directories.get(directory)
+                    if entry is None or entry["mtime"] != mtime:
+                        entry = self._scan_directory(directory, kind, mtime, guard)
+                        span.files += len(entry["files"])
+                        rescanned.add(directory)
+                        changed = True
+                    seen[directory] = entry
+                    stack.extend(os.path.join(directory, name) for name in entry["dirs"])
+
+        if changed or len(seen) != len(self.directories):
+            self.generation += 1
+            self.changed_directories = rescanned | (set(self.directories) - set(seen))
+            self.directories = seen
+            self._rebuild_lookup()
+            self.save()
+        return changed
+
+    def _scan_directory(self, directory, kind, mtime, guard):
+        dirs = []
+        files = []
+        try:
+            for entry in self.storage.scandir(directory):
+                if entry.is_dir:
+                    if not entry.name.startswith(".") and guard.follow(entry):
+                        dirs.append(entry.name)
+                else:
+                    files.append([entry.name, entry.size, entry.mtime])
+        except OSError:
+            pass
+        return {"kind": kind, "mtime": mtime, "dirs": sorted(dirs), "files": sorted(files)}
+
+    def folder_records(self, directory):
+        """FileRecords of the indexed files directly in directory."""
+        entry = self.directories.get(directory)
+        if entry is None:
+            return []
+        kind = entry["kind"]
+        return [FileRecord(name, os.path.join(directory, name), kind, size, mtime, parse_version(name))
+                for name, size, mtime in entry["files"] if is_indexed_name(name)]
+
+    def _rebuild_lookup(self):
+        records = []
+        for directory in self.directories:
+            records.extend(self.folder_records(directory))
+        records.sort()
+        self._records = records
+        self._keys = [record.name for record in records]
+
+    def find(self, prefix, kind=None):
+        """Return the FileRecord of every indexed file whose name starts with prefix."""
+        start = bisect.bisect_left(self._keys, prefix)
+        results = []
+        for i in range(start, len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            if kind is None or self._records[i].kind == kind:
+                results.append(self._records[i])
+        return results
+
+    def _current_entry(self, directory):
+        directory = os.path.normpath(directory)
+        entry = self.directories.get(directory)
+        if entry is None:
+            return None
+        try:
+            if self.storage.stat(directory).mtime != entry["mtime"]:
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def list_folders(self, directory):
+        """Sub-folder names of directory, or None when it is not indexed or has changed."""
+        entry = self._current_entry(directory)
+        return list(entry["dirs"]) if entry is not None else None
+
+    def list_files(self, directory):
+        """File names in directory, or None when it is not indexed or has changed."""
+        entry = self._current_entry(directory)
+        return [name for name, size, mtime in entry["files"]] if entry is not None else None
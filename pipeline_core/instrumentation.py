@@ -0,0 +1,151 @@
+"""Lightweight timing of the pipeline's hot paths.
+
+Scans, version resolution, exports and reference loads are wrapped with
+timed() or measure().  While recording is off (the default) those wrappers
+cost a single flag check.  When it is on, each call adds a Sample to an
+in-process ring buffer and, if a sink is set, appends it as a JSON line.
+
+Recording starts on import when $PIPELINE_TIMING is set, and samples go to
+the file named by $PIPELINE_TIMING_LOG if that is set too.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+Sample = namedtuple("Sample", ["stage", "name", "seconds", "files", "bytes", "started"])
+
+_enabled = False
+_samples = deque(maxlen=2000)
+_sink_path = None
+_sink_lock = threading.Lock()
+
+
+def enable(sink_path=None):
+    global _enabled, _sink_path
+    _enabled = True
+    if sink_path:
+        _sink_path = sink_path
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_sink(path):
+    """Append every sample to path as JSON lines, or stop doing so with None."""
+    global _sink_path
+    _sink_path = path
+
+
+def clear():
+    _samples.clear()
+
+
+def samples(stage=None):
+    return [sample for sample in list(_samples) if stage is None or sample.stage == stage]
+
+
+def record(stage, name, seconds, files=0, bytes=0, started=None):
+    sample = Sample(stage, name, seconds, files, bytes, started if started is not None else time.time() - seconds)
+    _samples.append(sample)
+    if _sink_path:
+        with _sink_lock:
+            try:
+                with open(_sink_path, "a") as handle:
+                    handle.write(json.dumps(sample._asdict()) + "\n")
+            except OSError:
+                pass
+
+
+class Span:
+    """Handed out by measure(); set files / bytes on it before the block ends."""
+    __slots__ = ("files", "bytes")
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+
+
+class _NullSpan:
+    __slots__ = ()
+    files = 0
+    bytes = 0
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@contextmanager
+def measure(stage, name=""):
+    if not _enabled:
+        yield _NULL_SPAN
+        return
+    span = Span()
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        record(stage, name, time.perf_counter() - start, span.files, span.bytes, started)
+
+
+def timed(stage, name=None):
+    """Decorator version of measure(). The sample's files count is len() of a list, dict or set result."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.time()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            files = len(result) if isinstance(result, (list, dict, set)) else 0
+            record(stage, label, time.perf_counter() - start, files, 0, started)
+            return result
+        return wrapper
+    return decorator
+
+
+def summarize():
+    """{stage: {"count", "total", "mean", "max", "files", "bytes"}} over the ring buffer."""
+    stages = {}
+    for sample in list(_samples):
+        stats = stages.setdefault(sample.stage, {"count": 0, "total": 0.0, "max": 0.0, "files": 0, "bytes": 0})
+        stats["count"] += 1
+        stats["total"] += sample.seconds
+        stats["max"] = max(stats["max"], sample.seconds)
+        stats["files"] += sample.files
+        stats["bytes"] += sample.bytes
+    for stats in stages.values():
+        stats["mean"] = stats["total"] / stats["count"]
+    return stages
+
+
+def format_summary():
+    if not _enabled and not _samples:
+        return "Timing is not being recorded."
+    lines = [f"{'stage':<18}{'calls':>6}{'total s':>10}{'mean ms':>10}{'max ms':>10}{'files':>8}{'MB':>9}"]
+    for stage, stats in sorted(summarize().items(), key=lambda item: item[1]["total"], reverse=True):
+        lines.append(f"{stage:<18}{stats['count']:>6}{stats['total']:>10.2f}{stats['mean'] * 1000:>10.1f}"
+                     f"{stats['max'] * 1000:>10.1f}{stats['files']:>8}{stats['bytes'] / (1024 * 1024):>9.1f}")
+    if not _enabled:
+        lines.append("(recording is off)")
+    return "\n".join(lines)
+
+
+if os.environ.get("PIPELINE_TIMING"):
+    enable(os.environ.get("PIPELINE_TIMING_LOG"))
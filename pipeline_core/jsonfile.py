@@ -0,0 +1,45 @@
+"""Small JSON files on the share that several artists may update at once."""
+import json
+import os
+import time
+
+
+def read_json(path, default=None):
+    try:
+        with open(path, "r") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as handle:
+        json.dump(data, handle, indent=2)
+    os.replace(temp_path, path)
+
+
+def locked_update(path, update, default, timeout=10.0):
+    """Read path, let update(data) change it in place and write it back under a lock file."""
+    lock_path = path + ".lock"
+    deadline = time.time() + timeout
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            if time.time() > deadline:
+                raise RuntimeError(f"Timed out waiting for {lock_path}")
+            time.sleep(0.05)
+    try:
+        data = read_json(path)
+        if data is None:
+            data = default()
+        update(data)
+        write_json(path, data)
+        return data
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
@@ -0,0 +1,228 @@
+"""Read-through cache of published caches on local disk.
+
+Scene Builder can reference Alembic/FBX files from a local copy instead of
+straight off the publish share.  fetch() returns the local copy when it is
+still valid (same size and mtime as the published file, and the same digest
+when the publish has a .sha256 sidecar) and copies the file in otherwise.
+The cache is bounded in size; the least recently used files are evicted
+first.  prefetch() copies files in the background, so a shot's caches can
+be pulled down as soon as the shot is selected.
+
+Several Maya sessions can share one cache.  save() merges this session's
+entries into the index on disk under its lock file, evicts over the merged
+index, and on a session's first save removes copies no index entry points
+to (left behind by a session that died before saving).  A miss saves at
+once; hits only update last_used in memory until the next save(), which
+the callers make after loading a shot.
+
+The cache lives in $PIPELINE_CACHE_DIR (default ~/.pipeline_cache) and is
+limited to $PIPELINE_CACHE_MAX_GB gigabytes (default 50).
+"""
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_core import instrumentation
+from pipeline_core.checksum import read_digest
+from pipeline_core.jsonfile import locked_update, read_json
+
+INDEX_FILE_NAME = "cache_index.json"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pipeline_cache")
+DEFAULT_MAX_GB = 50
+# Unindexed copies younger than this may belong to a session that has not saved yet
+ORPHAN_AGE_SECONDS = 3600
+
+
+class LocalCache:
+    def __init__(self, root=None, max_bytes=None, prefetch_workers=2):
+        self.root = root or os.environ.get("PIPELINE_CACHE_DIR") or DEFAULT_CACHE_DIR
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("PIPELINE_CACHE_MAX_GB", DEFAULT_MAX_GB)) * 1024 ** 3)
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.root, INDEX_FILE_NAME)
+        # cache key -> {"source", "local", "size", "mtime", "digest", "last_used"}
+        self.entries = read_json(self.index_path, {})
+        # key -> when this session evicted it, until the next save
+        self._removed = {}
+        self._swept = False
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.bytes_copied = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._prefetch_workers = prefetch_workers
+        self._pool = None
+
+    @staticmethod
+    def cache_key(source):
+        return hashlib.sha1(os.path.normcase(os.path.abspath(source)).encode("utf-8")).hexdigest()
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_valid(self, entry, stat, digest):
+        if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+            return False
+        if digest is not None and entry.get("digest") not in (None, digest):
+            return False
+        return os.path.exists(entry["local"])
+
+    def fetch(self, source):
+        """Path to a valid local copy of source, or source itself if it can't be cached."""
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return source
+        if stat.st_size > self.max_bytes:
+            return source
+
+        key = self.cache_key(source)
+        digest = read_digest(source)
+        with self._key_lock(key):
+            entry = self.entries.get(key)
+            if self._is_valid(entry, stat, digest):
+                with self._lock:
+                    entry["last_used"] = time.time()
+                    self.hits += 1
+                    self.bytes_saved += stat.st_size
+                return entry["local"]
+
+            local = os.path.join(self.root, key[:2], f"{key}_{os.path.basename(source)}")
+            try:
+                with instrumentation.measure("cache_copy", source) as span:
+                    os.makedirs(os.path.dirname(local), exist_ok=True)
+                    temp_path = f"{local}.{os.getpid()}.tmp"
+                    shutil.copyfile(source, temp_path)
+                    os.replace(temp_path, local)
+                    span.files = 1
+                    span.bytes = stat.st_size
+            except OSError as e:
+                print(f"Could not cache {source}: {e}")
+                return source
+
+            with self._lock:
+                self.entries[key] = {"source": source, "local": local, "size": stat.st_size,
+                                     "mtime": stat.st_mtime, "digest": digest, "last_used": time.time()}
+                self.misses += 1
+                self.bytes_copied += stat.st_size
+            self.save(keep=key)
+            return local
+
+    def _evict(self, entries, keep=None):
+        total = sum(entry["size"] for entry in entries.values())
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(entry["local"])
+            except OSError:
+                pass
+            total -= entry["size"]
+            del entries[key]
+
+    def _remove_orphans(self, entries):
+        known = {os.path.normcase(entry["local"]) for entry in entries.values()}
+        cutoff = time.time() - ORPHAN_AGE_SECONDS
+        try:
+            folders = [os.path.join(self.root, name) for name in os.listdir(self.root) if len(name) == 2]
+        except OSError:
+            return
+        for folder in folders:
+            try:
+                names = os.listdir(folder)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(folder, name)
+                if os.path.normcase(path) in known:
+                    continue
+                try:
+                    if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def _merge(self, entries, keep):
+        """Fold this session's entries into entries read from disk, then evict over the result."""
+        with self._lock:
+            for key, entry in self.entries.items():
+                known = entries.get(key)
+                if known is not None:
+                    if known["last_used"] < entry["last_used"]:
+                        entries[key] = entry
+                elif os.path.exists(entry["local"]):
+                    # Missing from disk and still present locally: not evicted by another session
+                    entries[key] = entry
+            for key, removed_at in self._removed.items():
+                if key in entries and entries[key]["last_used"] <= removed_at:
+                    del entries[key]
+            self._removed.clear()
+            self._evict(entries, keep)
+            if not self._swept:
+                self._remove_orphans(entries)
+                self._swept = True
+            self.entries = {key: dict(entry) for key, entry in entries.items()}
+
+    def save(self, keep=None):
+        """Merge this session's entries into the index on disk and evict down to max_bytes."""
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            locked_update(self.index_path, lambda entries: self._merge(entries, keep), dict)
+        except (OSError, RuntimeError) as e:
+            print(f"Could not write cache index {self.index_path}: {e}")
+
+    def prefetch(self, sources):
+        """Copy sources into the cache in the background; returns the futures."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._prefetch_workers)
+        return [self._pool.submit(self.fetch, source) for source in sources]
+
+    def clear(self):
+        with self._lock:
+            now = time.time()
+            for key, entry in self.entries.items():
+                try:
+                    os.remove(entry["local"])
+                except OSError:
+                    pass
+                self._removed[key] = now
+            self.entries.clear()
+        self.save()
+
+    def stats(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "bytes_copied": self.bytes_copied,
+                "cached_bytes": sum(entry["size"] for entry in self.entries.values()),
+                "max_bytes": self.max_bytes,
+            }
+
+    def format_stats(self):
+        stats = self.stats()
+        gigabyte = 1024.0 ** 3
+        return (f"Local cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+                f"{stats['bytes_saved'] / gigabyte:.2f} GB not re-read from the share, "
+                f"{stats['cached_bytes'] / gigabyte:.2f} of {stats['max_bytes'] / gigabyte:.0f} GB used")
+
+
+_cache = None
+
+
+def get_local_cache():
+    """The process-wide cache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = LocalCache()
+    return _cache
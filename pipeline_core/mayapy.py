@@ -0,0 +1,56 @@
+"""Locating mayapy and preparing the environment for mayapy worker processes."""
+import os
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGINS = ("AbcExport", "AbcImport", "fbxmaya", "mayaUsdPlugin")
+
+
+def find_mayapy():
+    mayapy = os.environ.get("MAYAPY")
+    if mayapy and os.path.exists(mayapy):
+        return mayapy
+    name = "mayapy.exe" if os.name == "nt" else "mayapy"
+    candidate = os.path.join(os.path.dirname(sys.executable), name)
+    return candidate if os.path.exists(candidate) else None
+
+
+def worker_environment():
+    """os.environ with this repository on PYTHONPATH, so workers can import pipeline_core."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PACKAGE_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def find_abc_stitcher(mayapy):
+    """The AbcStitcher executable shipped next to mayapy, or None."""
+    if not mayapy:
+        return None
+    name = "AbcStitcher.exe" if os.name == "nt" else "AbcStitcher"
+    candidate = os.path.join(os.path.dirname(mayapy), name)
+    return candidate if os.path.exists(candidate) else None
+
+
+def run_tool(command):
+    """Run a worker command, raising RuntimeError with the last line of stderr if it fails."""
+    completed = subprocess.run(command, capture_output=True, text=True, env=worker_environment())
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip()
+                           else f"{os.path.basename(command[0])} exited with code {completed.returncode}")
+
+
+def initialize_standalone():
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    import maya.cmds as cmds
+    for plugin in PLUGINS:
+        try:
+            cmds.loadPlugin(plugin, quiet=True)
+        except RuntimeError:
+            pass
+
+
+def uninitialize_standalone():
+    import maya.standalone
+    maya.standalone.uninitialize()
@@ -0,0 +1,70 @@
+"""Tells folders on network filesystems from local ones.
+
+Change notifications (QFileSystemWatcher, inotify, ReadDirectoryChangesW)
+only report changes made through this machine, so a folder on a share has
+to be polled to notice what other artists publish into it.  Besides UNC
+paths, mapped Windows drives and NFS / SMB / AFP mounts count as network
+paths.  Paths are not resolved, so checking one never touches the share.
+"""
+import os
+import subprocess
+
+NETWORK_FILESYSTEMS = {
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afpfs", "webdav", "ncpfs", "9p",
+    "fuse.sshfs", "glusterfs", "fuse.glusterfs", "ceph", "fuse.ceph", "lustre", "gpfs",
+}
+DRIVE_REMOTE = 4
+
+_mounts = None
+
+
+def _read_mounts():
+    mounts = []
+    try:
+        with open("/proc/mounts", "r") as handle:
+            for line in handle:
+                fields = line.split()
+                if len(fields) >= 3:
+                    mounts.append((fields[1].replace("\\040", " "), fields[2]))
+        return mounts
+    except OSError:
+        pass
+    # macOS and the BSDs: "<device> on <mount point> (<type>, <options>)"
+    try:
+        output = subprocess.run(["mount"], capture_output=True, text=True).stdout
+    except OSError:
+        return mounts
+    for line in output.splitlines():
+        if " on " in line and " (" in line:
+            point, details = line.split(" on ", 1)[1].rsplit(" (", 1)
+            mounts.append((point, details.split(",")[0].rstrip(")").strip()))
+    return mounts
+
+
+def mount_table():
+    """[(mount point, filesystem type)], longest mount point first, read once per session."""
+    global _mounts
+    if _mounts is None:
+        # Reversed first, so of two mounts on one point the one on top wins
+        _mounts = sorted(reversed(_read_mounts()), key=lambda mount: len(mount[0]), reverse=True)
+    return _mounts
+
+
+def filesystem_type(path):
+    """Type of the filesystem path is on, or None when it can't be told."""
+    path = os.path.abspath(path)
+    for point, fs_type in mount_table():
+        if path == point or path.startswith(point.rstrip("/") + "/"):
+            return fs_type
+    return None
+
+
+def is_network_path(path):
+    if path.startswith(("\\\\", "//")):
+        return True
+    if os.name == "nt":
+        import ctypes
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        return bool(drive) and ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    fs_type = filesystem_type(path)
+    return fs_type is not None and fs_type.lower() in NETWORK_FILESYSTEMS
@@ -0,0 +1,180 @@
+"""Memoised, lazily filled model of the project tree shared by the UI tools.
+
+A folder is listed the first time a tool asks for it and then kept with
+its mtime.  Asking again costs one stat to confirm nothing changed, and
+cached_folders() answers from memory without even that, so a menu can be
+filled straight away and corrected once the background check comes back.
+The open and save tools share one model, so a folder browsed in one is
+already known to the other.
+"""
+import os
+import threading
+
+from pipeline_core.file_index import ProjectFileIndex
+from pipeline_core.search_index import SearchIndex
+from pipeline_core.storage import get_storage
+from pipeline_core.versions import newest_first
+
+
+class ProjectTreeModel:
+    def __init__(self, storage=None):
+        self._storage = storage
+        # folder -> {"mtime", "folders", "files"}
+        self._nodes = {}
+        self._file_index = None
+        self._search_index = None
+        # Held while the search index is updated or queried, so queries never see it half-updated
+        self._search_lock = threading.Lock()
+        # project root -> Event set when the build or update in flight for it finishes
+        self._search_updates = {}
+        # (project root, asset) -> {label: path}, valid until the file index changes
+        self._asset_files = {}
+        # Guards the nodes and asset files; only ever held for dict work, never for I/O
+        self._lock = threading.Lock()
+        # Held while the file index loads, refreshes or is read, so the UI thread's cached_* calls don't wait on it
+        self._index_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def storage(self):
+        return self._storage or get_storage()
+
+    def _node(self, path):
+        path = os.path.normpath(path)
+        mtime = self.storage.stat(path).mtime
+        with self._lock:
+            node = self._nodes.get(path)
+            if node is not None and node["mtime"] == mtime:
+                self.hits += 1
+                return node
+        folders = []
+        files = []
+        for entry in self.storage.scandir(path):
+            if entry.is_dir:
+                # Hidden folders, such as the staging folder of a publish, are never browsed
+                if not entry.name.startswith("."):
+                    folders.append(entry.name)
+            else:
+                files.append(entry.name)
+        node = {"mtime": mtime, "folders": sorted(folders), "files": sorted(files)}
+        with self._lock:
+            self._nodes[path] = node
+            self.misses += 1
+        return node
+
+    def folders(self, path):
+        """Sub-folder names of path, listing it only if it changed. Raises OSError if it is missing."""
+        return list(self._node(path)["folders"])
+
+    def files(self, path):
+        return list(self._node(path)["files"])
+
+    def cached_folders(self, path):
+        """The last known sub-folders of path without touching storage, or None."""
+        with self._lock:
+            node = self._nodes.get(os.path.normpath(path))
+        return list(node["folders"]) if node is not None else None
+
+    def file_index(self, project_root):
+        """The refreshed file index of project_root."""
+        with self._index_lock:
+            index = self._file_index
+            replaced = index is None or index.project_root != os.path.normpath(project_root)
+            if replaced:
+                index = ProjectFileIndex(project_root, storage=self._storage)
+                index.load()
+            changed = index.refresh()
+            self._file_index = index
+        if replaced or changed:
+            with self._lock:
+                self._asset_files.clear()
+        return index
+
+    def update_search_index(self, project_root):
+        """Refresh the file index and bring the project's SearchIndex up to date with it.
+
+        Only one build or update runs per project at a time; callers that
+        arrive while one is in flight wait for it and share its result.
+        """
+        project_root = os.path.normpath(project_root)
+        with self._search_lock:
+            in_flight = self._search_updates.get(project_root)
+            if in_flight is None:
+                done = self._search_updates[project_root] = threading.Event()
+        if in_flight is not None:
+            in_flight.wait()
+            return self._search_index
+
+        try:
+            index = self.file_index(project_root)
+            search_index = self._search_index
+            # update() reads the file index's generation, changed folders and directories
+            # together; the index lock keeps a refresh on another scan thread from changing
+            # them in between
+            with self._index_lock:
+                if search_index is None or search_index.project_root != index.project_root:
+                    # Build a new index outside the search lock so searches of the old one don't wait on it
+                    search_index = SearchIndex(index.project_root)
+                    search_index.update(index)
+                    with self._search_lock:
+                        self._search_index = search_index
+                else:
+                    with self._search_lock:
+                        search_index.update(index)
+            return search_index
+        finally:
+            with self._search_lock:
+                del self._search_updates[project_root]
+            done.set()
+
+    def search(self, project_root, text, **filters):
+        """SearchIndex.search() on the index as last updated, or None if it hasn't been built yet."""
+        with self._search_lock:
+            search_index = self._search_index
+            if search_index is None or search_index.project_root != os.path.normpath(project_root):
+                return None
+            return search_index.search(text, **filters)
+
+    def asset_files(self, project_root, asset):
+        """{menu label: path} of asset's published files, newest first, then its wip files."""
+        index = self.file_index(project_root)
+        key = (index.project_root, asset)
+        with self._lock:
+            files = self._asset_files.get(key)
+        if files is not None:
+            return files
+        # Names and paths come from the same record so they can never be paired up wrongly;
+        # the index lock keeps a refresh on another scan thread from swapping the lookup mid-read
+        with self._index_lock:
+            publish = newest_first(index.find(asset, "publish"))
+            wip = newest_first(index.find(asset, "wip"))
+        files = {record.name: record.path for record in publish}
+        files.update({"(wip)" + record.name: record.path for record in wip})
+        with self._lock:
+            self._asset_files[key] = files
+        return files
+
+    def cached_asset_files(self, project_root, asset):
+        """asset_files() as last computed, without refreshing the index, or None."""
+        with self._lock:
+            return self._asset_files.get((os.path.normpath(project_root), asset))
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._nodes.clear()
+                self._asset_files.clear()
+            else:
+                self._nodes.pop(os.path.normpath(path), None)
+
+
+_model = None
+
+
+def get_project_model():
+    """The process-wide model shared by the tools."""
+    global _model
+    if _model is None:
+        _model = ProjectTreeModel()
+    return _model
@@ -0,0 +1,241 @@
+"""Multi-format publish stage used by the save tool.
+
+The selection and frame range are snapshotted once, then each format is
+exported as its own job.  When a mayapy executable is available, Alembic,
+FBX and USD jobs can run in background mayapy workers against a snapshot of
+the scene; everything else runs in order on Maya's main thread, since
+maya.cmds is not thread-safe.  Every format is exported into the export
+folder's hidden staging folder and only moved to its published name, and
+the publish manifest only written, when every format succeeded; otherwise
+all outputs of the publish are removed.
+Each output is then digested, and an output identical to the previous
+version is hardlinked to it rather than kept as a second copy.
+
+The frame range is the scene's playback range unless one is given.  A
+batch Alembic export can be split per root and into frame chunks that run
+in parallel (see alembic_chunks).
+"""
+import getpass
+import os
+import tempfile
+import time
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import maya.cmds as cmds
+
+from pipeline_core import instrumentation
+from pipeline_core.alembic_chunks import export_chunked
+from pipeline_core.checksum import dedupe_publish
+from pipeline_core.jsonfile import locked_update
+from pipeline_core.mayapy import find_mayapy, run_tool
+from pipeline_core.shot_manifest import PUBLISH_MANIFEST_NAME, find_shot_folder, update_shot_manifest
+from pipeline_core.version_registry import format_versioned_name
+
+BATCH_FORMATS = ("abc", "fbx", "usd")
+MANIFEST_NAME = PUBLISH_MANIFEST_NAME
+
+PublishSnapshot = namedtuple("PublishSnapshot", ["nodes", "frame_range", "scene"])
+# Exports write staged_path; path is where the file is published
+ExportJob = namedtuple("ExportJob", ["file_format", "version", "path", "staged_path"])
+ExportResult = namedtuple("ExportResult", ["job", "ok", "seconds", "error"])
+PublishReport = namedtuple("PublishReport", ["ok", "results", "manifest_path"])
+
+
+def playback_range():
+    return (cmds.playbackOptions(query=True, minTime=True), cmds.playbackOptions(query=True, maxTime=True))
+
+
+def snapshot_scene(frame_range=None):
+    """Snapshot the selection and frame_range, which defaults to the playback range."""
+    return PublishSnapshot(
+        nodes=cmds.ls(selection=True) or [],
+        frame_range=tuple(frame_range or playback_range()),
+        scene=cmds.file(query=True, sceneName=True),
+    )
+
+
+def snapshot_resume_key(snapshot, base_name):
+    """Identifies a snapshot across publish attempts, so interrupted chunked exports can resume.
+
+    A saved, unmodified scene is identified by its path and mtime; the roots
+    and frame range are part of the chunk plan export_chunked adds to the key.
+    A scene with unsaved changes can't be told apart from an edited one, so
+    it gets a key of its own every time and starts over.
+    """
+    scene = snapshot.scene
+    if scene and os.path.exists(scene) and not cmds.file(query=True, modified=True):
+        return f"{scene}|{os.path.getmtime(scene)}|{base_name}"
+    print("The scene has unsaved changes; save it first for an interrupted Alembic export to resume")
+    return f"{scene}|unsaved {uuid.uuid4().hex}|{base_name}"
+
+
+def export_format(file_format, file_path, snapshot):
+    """Write one format of the publish. Runs inside Maya or a mayapy worker."""
+    if file_format == "mb":
+        # A copy, so the open scene isn't renamed to the staging folder
+        cmds.file(file_path, force=True, exportAll=True, preserveReferences=True, type="mayaBinary")
+    elif file_format == "abc":
+        start, end = snapshot.frame_range
+        roots = " -root ".join(snapshot.nodes)
+        cmds.AbcExport(j=f"-frameRange {start} {end} -dataFormat ogawa -root {roots} -file {file_path}")
+    elif file_format == "fbx":
+        cmds.select(snapshot.nodes, replace=True)
+        cmds.file(file_path, force=True, options="v=0;", type="FBX export", pr=True, es=True)
+    elif file_format == "usd":
+        cmds.select(snapshot.nodes, replace=True)
+        cmds.file(file_path, force=True, options=";", type="USD Export", pr=True, es=True)
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+    print(f"{file_format.upper()} file saved at: {file_path}")
+
+
+def save_snapshot_scene():
+    handle, scene_path = tempfile.mkstemp(prefix="publish_snapshot_", suffix=".mb")
+    os.close(handle)
+    cmds.file(scene_path, force=True, exportAll=True, preserveReferences=True, type="mayaBinary")
+    return scene_path
+
+
+def run_batch_job(job, snapshot, scene_path, mayapy):
+    start, end = snapshot.frame_range
+    run_tool([mayapy, "-m", "pipeline_core.batch_export", scene_path, job.file_format, job.staged_path,
+              str(start), str(end)] + list(snapshot.nodes))
+
+
+def _timed(job, func, *args):
+    start = time.perf_counter()
+    try:
+        func(*args)
+    except Exception as e:
+        return ExportResult(job, False, time.perf_counter() - start, str(e))
+    seconds = time.perf_counter() - start
+    if instrumentation.is_enabled():
+        try:
+            size = os.path.getsize(job.staged_path)
+        except OSError:
+            size = 0
+        instrumentation.record("export", f"{job.file_format} {os.path.basename(job.path)}", seconds, 1, size)
+    return ExportResult(job, True, seconds, None)
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def previous_version_path(export_path, base_name, file_format, version):
+    for previous in range(version - 1, 0, -1):
+        path = os.path.join(export_path, format_versioned_name(base_name, previous, file_format))
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def write_manifest(export_path, entry):
+    """Append entry to the folder's publish manifest."""
+    manifest_path = os.path.join(export_path, MANIFEST_NAME)
+    locked_update(manifest_path, lambda manifest: manifest["publishes"].append(entry), lambda: {"publishes": []})
+    return manifest_path
+
+
+@instrumentation.timed("publish")
+def run_publish(export_path, base_name, file_formats, snapshot, registry, batch_workers=0, mayapy=None,
+                split_roots=False, chunk_frames=0):
+    jobs = []
+    for file_format in file_formats:
+        jobs.append(ExportJob(file_format, *registry.reserve(export_path, base_name, file_format)))
+
+    if batch_workers and mayapy is None:
+        mayapy = find_mayapy()
+    batch_jobs = [job for job in jobs if batch_workers and mayapy and job.file_format in BATCH_FORMATS]
+    local_jobs = [job for job in jobs if job not in batch_jobs]
+    if (split_roots or chunk_frames) and any(job.file_format == "abc" for job in local_jobs):
+        reason = "no mayapy was found" if batch_workers else "batch workers are off"
+        cmds.warning(f"Alembic split / chunk options ignored, they need mayapy batch workers and {reason}; "
+                     "exporting Alembic in one piece")
+
+    results = []
+    scene_path = None
+    pool = None
+    futures = []
+    try:
+        if batch_jobs:
+            scene_path = save_snapshot_scene()
+            pool = ThreadPoolExecutor(max_workers=min(batch_workers, len(batch_jobs)))
+            futures = []
+            for job in batch_jobs:
+                if job.file_format == "abc" and (split_roots or chunk_frames):
+                    futures.append(pool.submit(_timed, job, export_chunked, job.staged_path, snapshot, scene_path, mayapy,
+                                               batch_workers, snapshot_resume_key(snapshot, base_name),
+                                               split_roots, chunk_frames))
+                else:
+                    futures.append(pool.submit(_timed, job, run_batch_job, job, snapshot, scene_path, mayapy))
+        # The main-thread queue runs while the workers export
+        for job in local_jobs:
+            results.append(_timed(job, export_format, job.file_format, job.staged_path, snapshot))
+        results.extend(future.result() for future in futures)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if scene_path:
+            _discard(scene_path)
+
+    if not all(result.ok for result in results):
+        for job in jobs:
+            registry.release(job.staged_path)
+        return PublishReport(False, results, None)
+
+    placed = []
+    for job in jobs:
+        try:
+            registry.place(job.staged_path, job.path)
+        except OSError as e:
+            for other in jobs:
+                registry.release(other.staged_path)
+            for other in placed:
+                _discard(other.path)
+            results = [result._replace(ok=False, error=f"Could not publish {job.path}: {e}")
+                       if result.job is job else result for result in results]
+            return PublishReport(False, results, None)
+        placed.append(job)
+    for job in jobs:
+        if job.file_format == "mb":
+            # The open scene becomes the version just saved, as a Save As would
+            cmds.file(rename=job.path)
+            cmds.file(modified=False)
+
+    files = {}
+    for job in jobs:
+        registry.commit(export_path, base_name, job.file_format, job.version)
+        files[job.file_format] = {"version": job.version, "file": os.path.basename(job.path)}
+        previous_path = previous_version_path(export_path, base_name, job.file_format, job.version)
+        try:
+            digest, linked = dedupe_publish(job.path, previous_path)
+        except OSError as e:
+            print(f"Could not digest {job.path}: {e}")
+            continue
+        files[job.file_format]["digest"] = digest
+        if linked:
+            files[job.file_format]["same_as"] = os.path.basename(previous_path)
+            print(f"{os.path.basename(job.path)} is unchanged from {os.path.basename(previous_path)}; stored as a hardlink")
+    entry = {
+        "base_name": base_name,
+        "published_at": time.time(),
+        "user": getpass.getuser(),
+        "frame_range": list(snapshot.frame_range),
+        "nodes": list(snapshot.nodes),
+        "files": files,
+    }
+    manifest_path = write_manifest(export_path, entry)
+
+    shot_path, asset_type = find_shot_folder(export_path)
+    if shot_path:
+        try:
+            update_shot_manifest(shot_path, [asset_type])
+        except Exception as e:
+            print(f"Could not update the shot manifest in {shot_path}: {e}")
+    return PublishReport(True, results, manifest_path)
@@ -0,0 +1,94 @@
+"""The save/publish logic behind TheFinalSavingTool, usable without its UI."""
+import os
+
+import maya.cmds as cmds
+
+from pipeline_core.project_model import get_project_model
+from pipeline_core.publish import run_publish, snapshot_scene
+from pipeline_core.storage import get_storage
+from pipeline_core.version_registry import VersionRegistry
+
+
+class ArtistsTimeSortingSaveSystem:
+    def __init__(self):
+        self.project_path = ""
+        self.export_path = ""
+        self.alembic_path_stack = []
+        self.version_registry = VersionRegistry()
+        self.batch_workers = 0
+        # None publishes the playback range
+        self.frame_range = None
+        self.split_alembic_roots = False
+        self.alembic_chunk_frames = 0
+
+    def set_project_path(self, path):
+        self.project_path = path
+
+    def set_export_path(self, path):
+        self.export_path = path
+        print(f"Export path updated to: {self.export_path}")
+
+    def scan_folders(self, path):
+        # Safe to call from a scan thread, it doesn't touch maya.cmds
+        return get_project_model().folders(path)
+
+    def load_folders(self, path):
+        try:
+            return self.scan_folders(path)
+        except Exception as e:
+            cmds.warning(f"Error loading folders: {e}")
+            return []
+
+    def ensure_directory_exists(self, path):
+        storage = get_storage()
+        if not storage.exists(path):
+            storage.makedirs(path)
+
+    def generate_file_name(self, description, file_format):
+        parts = self.export_path.split(os.sep)
+        sequence_name = parts[-3] if len(parts) > 2 else "UnknownSeq"
+        action_name = parts[-2] if len(parts) > 1 else "UnknownAction"
+        sequence_name_p = parts[-4] if len(parts) > 3 else "UnknownSeq"
+        action_name_p = parts[-3] if len(parts) > 2 else "UnknownAction"
+
+
+        # The version suffix and extension are added per format in save_file
+        if "publish" in parts:
+            return f"{sequence_name_p}_{description}_{action_name_p}"
+        elif "wip" in parts:
+            return f"{sequence_name}_{action_name}"
+
+    def find_latest_version(self, base_name, extension):
+        return self.version_registry.next_version(self.export_path, base_name, extension)
+
+    def publish(self, description, file_formats):
+        """Export file_formats into export_path and return the PublishReport.
+
+        Raises ValueError when a non-mb format is requested with nothing selected.
+        """
+        self.ensure_directory_exists(self.export_path)
+
+        base_name = self.generate_file_name(description, file_formats[0])
+        snapshot = snapshot_scene(self.frame_range)
+        if not snapshot.nodes and any(file_format != "mb" for file_format in file_formats):
+            raise ValueError("No valid root nodes were specified.")
+
+        report = run_publish(self.export_path, base_name, file_formats, snapshot,
+                             self.version_registry, batch_workers=self.batch_workers,
+                             split_roots=self.split_alembic_roots, chunk_frames=self.alembic_chunk_frames)
+        for result in report.results:
+            print(f"{result.job.file_format.upper()} export took {result.seconds:.2f}s")
+        return report
+
+    def save_file(self, description, file_formats):
+        try:
+            report = self.publish(description, file_formats)
+            if not report.ok:
+                errors = "; ".join(f"{result.job.file_format}: {result.error}" for result in report.results if not result.ok)
+                return f"Error saving file: {errors}"
+
+            return f"Files saved in: {self.export_path}"
+        except ValueError as e:
+            return f"Error: {e}"
+        except Exception as e:
+            return f"Error saving file: {str(e)}"
@@ -0,0 +1,55 @@
+"""Single-pass directory walking that yields one compact record per file."""
+import fnmatch
+import os
+import re
+from collections import namedtuple
+
+from pipeline_core.storage import LinkGuard, get_storage
+from pipeline_core.versions import parse_version
+
+FileRecord = namedtuple("FileRecord", ["name", "path", "kind", "size", "mtime", "version"])
+
+
+def compile_pattern(pattern):
+    """Turn a glob such as "char001*" into a match function (case-insensitive on Windows)."""
+    if not pattern or pattern == "*":
+        return None
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
+def make_record(entry, kind):
+    return FileRecord(entry.name, entry.path, kind, entry.size, entry.mtime, parse_version(entry.name))
+
+
+def walk_files(directory, kind="", pattern=None, extensions=None, recursive=True, storage=None):
+    """Yield a FileRecord for every file under directory in one traversal.
+
+    pattern is a glob matched against the file name and extensions a tuple of
+    suffixes such as (".abc", ".fbx"); both are applied during the walk.  This
+    is a generator, so callers can stop as soon as they have what they need.
+    """
+    storage = storage or get_storage()
+    match = compile_pattern(pattern)
+    if extensions:
+        extensions = tuple(ext.lower() for ext in extensions)
+    guard = LinkGuard(storage, directory)
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = storage.scandir(current)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir:
+                # Hidden folders hold in-flight publishes and tool state, never published files
+                if recursive and not entry.name.startswith(".") and guard.follow(entry):
+                    stack.append(entry.path)
+                continue
+            name = entry.name
+            if extensions and not name.lower().endswith(extensions):
+                continue
+            if match is not None and not match(name):
+                continue
+            yield make_record(entry, kind)
@@ -0,0 +1,209 @@
+"""Search-as-you-type over every publish and wip file name in a project.
+
+Names are indexed by trigram, and the filter fields (kind, format, asset
+type, shot) get posting sets of their own.  A query intersects the sets it
+needs starting from the smallest, then checks the substring, so a filter
+narrows the work instead of adding to it.  When the smallest set is big
+enough that walking the names in sorted order should reach the result limit
+sooner than checking every candidate, the walk is used instead and stops at
+the limit.  Queries shorter than a trigram match name prefixes.
+
+The index is filled from a ProjectFileIndex.  update() applies only the
+folders the file index's last refresh re-listed, and falls back to
+comparing every folder's mtime when it has missed a refresh.
+"""
+import bisect
+import heapq
+import os
+from collections import namedtuple
+
+SearchHit = namedtuple("SearchHit", ["record", "kind", "asset_type", "file_format", "sequence", "shot"])
+
+DEFAULT_LIMIT = 200
+FILTER_FIELDS = ("kind", "asset_type", "file_format", "shot")
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def describe_folder(project_root, directory):
+    """(asset type, sequence, shot) of a folder from its place in the publish / wip layout."""
+    parts = os.path.relpath(directory, project_root).split(os.sep)
+    if len(parts) >= 5 and parts[1] == "sequence":
+        return parts[4], parts[2], parts[3]
+    if len(parts) >= 3 and parts[1] == "assets":
+        return parts[2], "", ""
+    return "", "", ""
+
+
+def _field_keys(hit):
+    return [(field, getattr(hit, field).lower()) for field in FILTER_FIELDS]
+
+
+class SearchIndex:
+    def __init__(self, project_root):
+        self.project_root = os.path.normpath(project_root)
+        self._hits = []  # hit id -> SearchHit, None once removed
+        self._lower_names = []
+        self._grams = {}  # trigram -> set of hit ids
+        self._fields = {}  # (field, lower-case value) -> set of hit ids
+        self._folders = {}  # folder -> (mtime, [hit ids])
+        self._live = 0
+        # file_index.generation this index was last brought in line with
+        self._generation = None
+        # Live hit ids sorted by lower-case name, and those names; rebuilt lazily
+        self._order = None
+        self._order_names = None
+
+    def __len__(self):
+        return self._live
+
+    def update(self, file_index):
+        """Bring the index in line with file_index; returns True if anything changed."""
+        if self._generation == file_index.generation:
+            return False
+        if len(self._hits) > 2 * self._live + 10000:
+            # Mostly removed entries: start over rather than carry them around
+            self.__init__(self.project_root)
+
+        directories = file_index.directories
+        if self._generation is not None and self._generation + 1 == file_index.generation \
+                and file_index.changed_directories is not None:
+            folders = file_index.changed_directories
+        else:
+            folders = set(self._folders) | set(directories)
+        changed = False
+        for folder in folders:
+            entry = directories.get(folder)
+            known = self._folders.get(folder)
+            if known is not None and entry is not None and known[0] == entry["mtime"]:
+                continue
+            if known is not None:
+                self._remove_folder(folder)
+            if entry is not None:
+                self._add_folder(folder, entry, file_index)
+            changed = True
+        self._generation = file_index.generation
+        if changed:
+            self._order = self._order_names = None
+        return changed
+
+    def _add_folder(self, folder, entry, file_index):
+        asset_type, sequence, shot = describe_folder(self.project_root, folder)
+        ids = []
+        for record in file_index.folder_records(folder):
+            hit_id = len(self._hits)
+            lower_name = record.name.lower()
+            hit = SearchHit(record, entry["kind"], asset_type,
+                            os.path.splitext(record.name)[1].lstrip(".").lower(), sequence, shot)
+            self._hits.append(hit)
+            self._lower_names.append(lower_name)
+            for gram in trigrams(lower_name):
+                self._grams.setdefault(gram, set()).add(hit_id)
+            for key in _field_keys(hit):
+                self._fields.setdefault(key, set()).add(hit_id)
+            ids.append(hit_id)
+        self._folders[folder] = (entry["mtime"], ids)
+        self._live += len(ids)
+
+    @staticmethod
+    def _discard(postings, key, hit_id):
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(hit_id)
+            if not ids:
+                del postings[key]
+
+    def _remove_folder(self, folder):
+        mtime, ids = self._folders.pop(folder)
+        for hit_id in ids:
+            for gram in trigrams(self._lower_names[hit_id]):
+                self._discard(self._grams, gram, hit_id)
+            for key in _field_keys(self._hits[hit_id]):
+                self._discard(self._fields, key, hit_id)
+            self._hits[hit_id] = None
+        self._live -= len(ids)
+
+    def _sorted_order(self):
+        if self._order is None:
+            self._order = sorted((hit_id for hit_id, hit in enumerate(self._hits) if hit is not None),
+                                 key=self._lower_names.__getitem__)
+            self._order_names = [self._lower_names[hit_id] for hit_id in self._order]
+        return self._order, self._order_names
+
+    def _postings(self, text, filters):
+        """The posting sets a query must be in, smallest first, or None if one of them is empty."""
+        postings = []
+        for field, value in filters.items():
+            if value:
+                ids = self._fields.get((field, value.lower()))
+                if not ids:
+                    return None
+                postings.append(ids)
+        if len(text) >= 3:
+            for gram in trigrams(text):
+                ids = self._grams.get(gram)
+                if not ids:
+                    return None
+                postings.append(ids)
+        return sorted(postings, key=len)
+
+    def search(self, text, kind=None, asset_type=None, file_format=None, shot=None,
+               min_version=None, max_version=None, limit=DEFAULT_LIMIT):
+        """SearchHits whose name contains text and that pass every given filter, sorted by name."""
+        text = text.lower().strip()
+        if not text:
+            return []
+        filters = {"kind": kind, "asset_type": asset_type,
+                   "file_format": file_format.lstrip(".") if file_format else None, "shot": shot}
+        postings = self._postings(text, filters)
+        if postings is None:
+            return []
+        names = self._lower_names
+        hits = self._hits
+        prefix = len(text) < 3
+
+        def wanted(hit_id):
+            name = names[hit_id]
+            if not (name.startswith(text) if prefix else text in name):
+                return False
+            if min_version is not None or max_version is not None:
+                version = hits[hit_id].record.version
+                if version is None:
+                    return False
+                if min_version is not None and version < min_version:
+                    return False
+                if max_version is not None and version > max_version:
+                    return False
+            return all(hit_id in ids for ids in postings[1:])
+
+        # A walk in name order passes about limit * live / candidates names before it
+        # has limit results; take it when that is fewer than the candidates
+        if not postings or (limit and len(postings[0]) ** 2 > limit * self._live):
+            order, order_names = self._sorted_order()
+            if prefix:
+                positions = range(bisect.bisect_left(order_names, text), len(order_names))
+            else:
+                positions = (position for position, name in enumerate(order_names) if text in name)
+            results = []
+            for position in positions:
+                hit_id = order[position]
+                if prefix and not order_names[position].startswith(text):
+                    break
+                if (not postings or hit_id in postings[0]) and wanted(hit_id):
+                    results.append(hits[hit_id])
+                    if limit and len(results) >= limit:
+                        break
+            return results
+
+        if prefix:
+            matches = [hit_id for hit_id in postings[0] if names[hit_id].startswith(text)]
+        else:
+            matches = [hit_id for hit_id in postings[0] if text in names[hit_id]]
+        matches = [hit_id for hit_id in matches if wanted(hit_id)]
+        if limit:
+            matches = heapq.nsmallest(limit, matches, key=names.__getitem__)
+        else:
+            matches.sort(key=names.__getitem__)
+        return [hits[hit_id] for hit_id in matches]
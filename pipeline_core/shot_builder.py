@@ -0,0 +1,37 @@
+"""Scene Builder's shot assembly, usable without its UI."""
+import os
+
+from pipeline_core.shot_manifest import SHOT_ASSET_FOLDERS, resolve_shot
+
+
+def get_shot_path(project_folder, sequence, shot):
+    return os.path.join(project_folder, "publish", "sequence", sequence, shot)
+
+
+def asset_namespace(sequence, shot, asset_type):
+    return f"{sequence}_{shot}_{asset_type.replace(' ', '_')}"
+
+
+def latest_versions(project_folder, sequence, shot, read_only=False):
+    """{asset type: latest file path or None} for the shot, or None when the shot doesn't exist."""
+    assets = resolve_shot(get_shot_path(project_folder, sequence, shot), read_only)
+    if assets is None:
+        return None
+    return {asset_type: (assets[asset_type][1].path if assets.get(asset_type, (None, None))[1] else None)
+            for asset_type in SHOT_ASSET_FOLDERS}
+
+
+def shot_references(project_folder, sequence, shot):
+    """(namespace, latest file) for every asset type of the shot that has been published."""
+    references = []
+    for asset_type, path in (latest_versions(project_folder, sequence, shot) or {}).items():
+        if path:
+            references.append((asset_namespace(sequence, shot, asset_type), path))
+    return references
+
+
+def assemble_shot(project_folder, sequence, shot, proxy_first=False, localize=None):
+    """Reference the shot's latest assets into the open scene and return the ReferenceTimings."""
+    from pipeline_core.assembly import assemble_references
+    return assemble_references(shot_references(project_folder, sequence, shot), proxy_first=proxy_first,
+                               localize=localize)
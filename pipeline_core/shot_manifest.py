@@ -0,0 +1,158 @@
+"""Per-shot manifest of the latest and historical version of every asset type.
+
+Publishing rewrites the entry of the asset type it published into.  Scene
+Builder resolves a shot by reading the manifest and stat-ing each asset
+folder: only folders whose mtime no longer matches the manifest are listed
+again, so a shot resolves without any directory listing in the common case.
+"""
+import os
+from collections import namedtuple
+
+from pipeline_core import instrumentation
+from pipeline_core.jsonfile import locked_update, read_json, write_json
+from pipeline_core.scan import FileRecord, walk_files
+from pipeline_core.storage import get_storage
+from pipeline_core.versions import VersionIndex, latest_record, version_sort_key
+
+SHOT_MANIFEST_NAME = "shot_manifest.json"
+PUBLISH_MANIFEST_NAME = "publish_manifest.json"
+MANIFEST_FORMAT = 1
+ASSET_EXTENSIONS = (".mb", ".fbx", ".abc", ".ma")
+SHOT_ASSET_FOLDERS = {
+    "set": os.path.join("set", "source"),
+    "layout (camera)": os.path.join("layout", "caches", "fbx"),
+    "character animation cache": os.path.join("animation", "caches", "alembic"),
+    "prop cache": os.path.join("prop", "caches", "alembic")
+}
+
+VersionHistoryEntry = namedtuple("VersionHistoryEntry", ["record", "publisher"])
+
+
+def find_shot_folder(export_path):
+    """Split a publish folder into (shot folder, asset type), or (None, None)."""
+    export_path = os.path.normpath(export_path)
+    for asset_type, subfolder in SHOT_ASSET_FOLDERS.items():
+        suffix = os.sep + subfolder
+        if export_path.endswith(suffix):
+            return export_path[:-len(suffix)], asset_type
+    return None, None
+
+
+def _folder_mtime(folder):
+    try:
+        return get_storage().stat(folder).mtime
+    except OSError:
+        return None
+
+
+def scan_asset_entry(shot_path, asset_type):
+    subfolder = SHOT_ASSET_FOLDERS[asset_type]
+    asset_folder = os.path.join(shot_path, subfolder)
+    folder_mtime = _folder_mtime(asset_folder)
+    records = []
+    if folder_mtime is not None:
+        with instrumentation.measure("scan", asset_folder) as span:
+            records = sorted(walk_files(asset_folder, "publish", extensions=ASSET_EXTENSIONS, recursive=False))
+            span.files = len(records)
+    latest = latest_record(records)
+    return {
+        "folder": subfolder,
+        "folder_mtime": folder_mtime,
+        "latest": latest.name if latest else None,
+        "versions": [[record.name, record.size, record.mtime, record.version] for record in records],
+    }
+
+
+def entry_records(shot_path, entry):
+    asset_folder = os.path.join(shot_path, entry["folder"])
+    return [FileRecord(name, os.path.join(asset_folder, name), "publish", size, mtime, version)
+            for name, size, mtime, version in entry["versions"]]
+
+
+def latest_entry_record(shot_path, entry):
+    for record in entry_records(shot_path, entry):
+        if record.name == entry["latest"]:
+            return record
+    return None
+
+
+def _empty_manifest():
+    return {"format": MANIFEST_FORMAT, "assets": {}}
+
+
+def update_shot_manifest(shot_path, asset_types=None):
+    """Rescan asset_types (all of them by default) and store them in the shot manifest."""
+    asset_types = asset_types or list(SHOT_ASSET_FOLDERS)
+
+    def update(manifest):
+        if manifest.get("format") != MANIFEST_FORMAT:
+            manifest.clear()
+            manifest.update(_empty_manifest())
+        for asset_type in asset_types:
+            manifest["assets"][asset_type] = scan_asset_entry(shot_path, asset_type)
+
+    return locked_update(os.path.join(shot_path, SHOT_MANIFEST_NAME), update, _empty_manifest)
+
+
+def load_shot_manifest(shot_path, read_only=False):
+    """Return the shot manifest, rescanning only asset folders that changed since it was written.
+
+    The rescanned entries are written back unless read_only is set.
+    """
+    manifest_path = os.path.join(shot_path, SHOT_MANIFEST_NAME)
+    manifest = read_json(manifest_path)
+    if not manifest or manifest.get("format") != MANIFEST_FORMAT:
+        manifest = _empty_manifest()
+
+    stale = False
+    for asset_type, subfolder in SHOT_ASSET_FOLDERS.items():
+        entry = manifest["assets"].get(asset_type)
+        if entry is None or entry["folder_mtime"] != _folder_mtime(os.path.join(shot_path, subfolder)):
+            manifest["assets"][asset_type] = scan_asset_entry(shot_path, asset_type)
+            stale = True
+
+    if stale and not read_only:
+        try:
+            write_json(manifest_path, manifest)
+        except OSError as e:
+            print(f"Could not update shot manifest {manifest_path}: {e}")
+    return manifest
+
+
+@instrumentation.timed("version_resolution")
+def resolve_shot(shot_path, read_only=False):
+    """{asset type: (folder, latest FileRecord or None)} for each asset folder that exists."""
+    if not get_storage().exists(shot_path):
+        return None
+    manifest = load_shot_manifest(shot_path, read_only)
+    assets = {}
+    for asset_type, entry in manifest["assets"].items():
+        if entry["folder_mtime"] is not None:
+            assets[asset_type] = (os.path.join(shot_path, entry["folder"]), latest_entry_record(shot_path, entry))
+    return assets
+
+
+def read_publishers(asset_folder):
+    """{file name: user} from the publish manifest the save tool writes into asset_folder."""
+    manifest = read_json(os.path.join(asset_folder, PUBLISH_MANIFEST_NAME), {})
+    publishers = {}
+    for publish in manifest.get("publishes", []):
+        for info in publish.get("files", {}).values():
+            publishers[info["file"]] = publish.get("user")
+    return publishers
+
+
+def version_history(shot_path, asset_type):
+    """Every published version of asset_type in the shot, newest first.
+
+    Versions are grouped by asset, the asset with the newest version first,
+    so rolling back walks down one asset's versions.
+    """
+    entry = load_shot_manifest(shot_path)["assets"].get(asset_type)
+    if not entry or entry["folder_mtime"] is None:
+        return []
+    publishers = read_publishers(os.path.join(shot_path, entry["folder"]))
+    index = VersionIndex.from_records(entry_records(shot_path, entry))
+    assets = sorted(index.assets(), key=lambda key: version_sort_key(index.latest(key)), reverse=True)
+    return [VersionHistoryEntry(record, publishers.get(record.name))
+            for key in assets for record in index.history(key)]
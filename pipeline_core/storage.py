@@ -0,0 +1,348 @@
+"""Where the tools read project metadata from.
+
+Scanning and version resolution list folders and stat files through a
+storage backend instead of calling os directly:
+
+    LocalStorage     the local or mounted filesystem (the default)
+    MemoryStorage    an in-memory tree with optional per-call latency, for
+                     deterministic benchmarks of very large projects
+    BatchedStorage   wraps another backend and fetches a whole subtree with
+                     one scan_tree() call the first time anything in it is read
+
+Only metadata goes through the backend.  Reading and writing file contents
+(exports, digests, the local cache) still uses the real filesystem.
+
+Symlinked folders are folders: a sequence or shot linked in from another
+volume is listed like any other.  Walkers ask a LinkGuard before descending
+into a link, so a link back into the tree can't make them loop.
+"""
+import os
+import stat
+import threading
+import time
+from collections import Counter, namedtuple
+
+# Directory entries from scandir() have no size, and their mtime is None
+# unless the backend can supply it without another call.  is_link marks
+# symlinks, which scandir() reports as what they point to.
+StorageEntry = namedtuple("StorageEntry", ["name", "path", "is_dir", "size", "mtime", "is_link"],
+                          defaults=(False,))
+
+
+def _is_within(path, folder):
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
+
+
+class LinkGuard:
+    """Decides which symlinked folders a walk from root may descend into.
+
+    A link whose target is inside, or above, a tree the walk already covers
+    (root itself or the target of a link it followed) would list folders
+    twice or loop forever, so it is skipped.
+    """
+
+    def __init__(self, storage, root):
+        self.storage = storage
+        self.root = root
+        self.walked = None  # real paths of the trees being walked, resolved at the first link
+
+    def follow(self, entry):
+        if not entry.is_link:
+            return True
+        if self.walked is None:
+            self.walked = [self.storage.realpath(self.root)]
+        try:
+            target = self.storage.realpath(entry.path)
+        except OSError:
+            return False
+        if any(_is_within(target, walked) or _is_within(walked, target) for walked in self.walked):
+            return False
+        self.walked.append(target)
+        return True
+
+
+class Storage:
+    """Interface of a storage backend. Missing paths raise OSError."""
+
+    def listdir(self, path):
+        raise NotImplementedError
+
+    def scandir(self, path):
+        """A StorageEntry for every child of path, files with their size and mtime."""
+        raise NotImplementedError
+
+    def stat(self, path):
+        raise NotImplementedError
+
+    def makedirs(self, path):
+        raise NotImplementedError
+
+    def realpath(self, path):
+        """path with every symlink resolved; backends without links return it as is."""
+        return os.path.normpath(path)
+
+    def exists(self, path):
+        try:
+            self.stat(path)
+        except OSError:
+            return False
+        return True
+
+    def isdir(self, path):
+        try:
+            return self.stat(path).is_dir
+        except OSError:
+            return False
+
+    def list_subfolders(self, path):
+        return [entry.name for entry in self.scandir(path) if entry.is_dir]
+
+    def list_files(self, path):
+        return [entry.name for entry in self.scandir(path) if not entry.is_dir]
+
+    def scan_tree(self, path):
+        """{directory: [StorageEntry, ...]} for path and every folder below it."""
+        tree = {}
+        guard = LinkGuard(self, path)
+        stack = [path]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = self.scandir(directory)
+            except OSError:
+                continue
+            tree[os.path.normpath(directory)] = entries
+            stack.extend(entry.path for entry in entries if entry.is_dir and guard.follow(entry))
+        return tree
+
+
+class LocalStorage(Storage):
+    def listdir(self, path):
+        return os.listdir(path)
+
+    def scandir(self, path):
+        entries = []
+        with os.scandir(path) as scanned:
+            for entry in scanned:
+                try:
+                    is_link = entry.is_symlink()
+                    if entry.is_dir():
+                        entries.append(StorageEntry(entry.name, entry.path, True, None, None, is_link))
+                    else:
+                        entry_stat = entry.stat()
+                        entries.append(StorageEntry(entry.name, entry.path, False, entry_stat.st_size,
+                                                    entry_stat.st_mtime, is_link))
+                except OSError:
+                    # Broken links and entries removed while listing
+                    continue
+        return entries
+
+    def list_subfolders(self, path):
+        with os.scandir(path) as scanned:
+            return [entry.name for entry in scanned if entry.is_dir()]
+
+    def list_files(self, path):
+        with os.scandir(path) as scanned:
+            return [entry.name for entry in scanned if not entry.is_dir()]
+
+    def stat(self, path):
+        path_stat = os.stat(path)
+        return StorageEntry(os.path.basename(path), path, stat.S_ISDIR(path_stat.st_mode),
+                            path_stat.st_size, path_stat.st_mtime)
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def isdir(self, path):
+        return os.path.isdir(path)
+
+    def makedirs(self, path):
+        os.makedirs(path, exist_ok=True)
+
+    def realpath(self, path):
+        return os.path.realpath(path)
+
+
+class MemoryStorage(Storage):
+    """A fake filesystem held in dictionaries.
+
+    Every call sleeps for latency seconds first and is counted in calls, so
+    benchmarks can model a slow share and count round trips.  Adding or
+    removing a file bumps its folder's mtime, like a real filesystem.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self._folders = {}  # folder -> {name: StorageEntry}
+        self._folder_mtimes = {}
+        self._clock = 1.0
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _tick(self):
+        self._clock += 1.0
+        return self._clock
+
+    def _ensure_folder(self, folder):
+        folder = os.path.normpath(folder)
+        missing = []
+        while folder not in self._folders:
+            missing.append(folder)
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                break
+            folder = parent
+        for folder in reversed(missing):
+            self._folders[folder] = {}
+            self._folder_mtimes[folder] = self._tick()
+            parent = os.path.dirname(folder)
+            if parent != folder and parent in self._folders:
+                self._folders[parent][os.path.basename(folder)] = StorageEntry(
+                    os.path.basename(folder), folder, True, None, None)
+                self._folder_mtimes[parent] = self._clock
+
+    def add_file(self, path, size=0, mtime=None):
+        path = os.path.normpath(path)
+        folder, name = os.path.split(path)
+        with self._lock:
+            self._ensure_folder(folder)
+            mtime = self._tick() if mtime is None else mtime
+            self._folders[folder][name] = StorageEntry(name, path, False, size, mtime)
+            self._folder_mtimes[folder] = self._clock
+
+    def remove(self, path):
+        path = os.path.normpath(path)
+        folder, name = os.path.split(path)
+        with self._lock:
+            del self._folders[folder][name]
+            self._folder_mtimes[folder] = self._tick()
+
+    def file_count(self):
+        return sum(1 for entries in self._folders.values() for entry in entries.values() if not entry.is_dir)
+
+    def _folder(self, path):
+        try:
+            return self._folders[os.path.normpath(path)]
+        except KeyError:
+            raise FileNotFoundError(path)
+
+    def listdir(self, path):
+        self._call("listdir")
+        return list(self._folder(path))
+
+    def scandir(self, path):
+        self._call("scandir")
+        return self._entries(self._folder(path))
+
+    def _entries(self, entries):
+        return [entry._replace(mtime=self._folder_mtimes[entry.path]) if entry.is_dir else entry
+                for entry in entries.values()]
+
+    def stat(self, path):
+        self._call("stat")
+        path = os.path.normpath(path)
+        if path in self._folders:
+            return StorageEntry(os.path.basename(path), path, True, 0, self._folder_mtimes[path])
+        folder, name = os.path.split(path)
+        entry = self._folders.get(folder, {}).get(name)
+        if entry is None:
+            raise FileNotFoundError(path)
+        return entry
+
+    def makedirs(self, path):
+        self._call("makedirs")
+        with self._lock:
+            self._ensure_folder(path)
+
+    def scan_tree(self, path):
+        # A real metadata service answers this in one request
+        self._call("scan_tree")
+        root = os.path.normpath(path)
+        prefix = root + os.sep
+        return {folder: self._entries(entries) for folder, entries in self._folders.items()
+                if folder == root or folder.startswith(prefix)}
+
+
+class BatchedStorage(Storage):
+    """Serves reads under prefetch_roots from one scan_tree() of each root.
+
+    A root is fetched the first time anything under it is read and kept
+    until invalidate().  Paths outside the roots go straight to the backend.
+    """
+
+    def __init__(self, backend, prefetch_roots=()):
+        self.backend = backend
+        self.prefetch_roots = [os.path.normpath(root) for root in prefetch_roots]
+        self._trees = {}
+        self._lock = threading.Lock()
+
+    def add_prefetch_root(self, root):
+        root = os.path.normpath(root)
+        if root not in self.prefetch_roots:
+            self.prefetch_roots.append(root)
+
+    def invalidate(self, root=None):
+        with self._lock:
+            if root is None:
+                self._trees.clear()
+            else:
+                self._trees.pop(os.path.normpath(root), None)
+
+    def _tree_for(self, path):
+        path = os.path.normpath(path)
+        for root in self.prefetch_roots:
+            if path == root or path.startswith(root + os.sep):
+                with self._lock:
+                    tree = self._trees.get(root)
+                    if tree is None:
+                        tree = self._trees[root] = self.backend.scan_tree(root)
+                return tree, path
+        return None, path
+
+    def listdir(self, path):
+        return [entry.name for entry in self.scandir(path)]
+
+    def scandir(self, path):
+        tree, path = self._tree_for(path)
+        if tree is None:
+            return self.backend.scandir(path)
+        if path not in tree:
+            raise FileNotFoundError(path)
+        return tree[path]
+
+    def stat(self, path):
+        tree, path = self._tree_for(path)
+        parent = os.path.dirname(path)
+        if tree is None or parent not in tree:
+            return self.backend.stat(path)
+        for entry in tree[parent]:
+            if entry.name == os.path.basename(path):
+                # Fall back to the backend for folders whose mtime wasn't fetched
+                return entry if entry.mtime is not None else self.backend.stat(path)
+        raise FileNotFoundError(path)
+
+    def realpath(self, path):
+        return self.backend.realpath(path)
+
+    def makedirs(self, path):
+        self.backend.makedirs(path)
+        self.invalidate()
+
+
+_storage = LocalStorage()
+
+
+def get_storage():
+    return _storage
+
+
+def set_storage(storage):
+    """Make storage the backend every tool uses and return the previous one."""
+    global _storage
+    previous, _storage = _storage, storage
+    return previous
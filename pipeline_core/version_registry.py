@@ -0,0 +1,156 @@
+"""Per-folder registry of the highest published version of each file.
+
+Each export folder is listed once; after that the registry is updated in
+place as versions are saved.  New versions are claimed by creating a
+placeholder with O_CREAT | O_EXCL in the folder's hidden staging folder, so
+two artists publishing into the same folder at the same time can never both
+get the same vNNN.  Exports are written over the placeholder and only moved
+to their published name by place(), so nothing that lists the folder ever
+sees an empty or half-written version.  A placeholder left behind by a
+session that died mid-publish is taken over once it is STALE_CLAIM_HOURS
+old, so its version is not skipped forever.
+"""
+import os
+import threading
+import time
+
+from pipeline_core import instrumentation
+from pipeline_core.storage import get_storage
+from pipeline_core.versions import VersionIndex
+
+# Hidden, so folder menus, the file index and the scanners skip it
+STAGING_FOLDER = ".publishing"
+# Longer than any export takes; an older placeholder belongs to a session that died
+STALE_CLAIM_HOURS = 12
+
+
+def format_versioned_name(base_name, version, extension):
+    return f"{base_name}_v{str(version).zfill(3)}.{extension}"
+
+
+def staging_path(folder, name):
+    return os.path.join(folder, STAGING_FOLDER, name)
+
+
+class VersionRegistry:
+    def __init__(self, storage=None):
+        self._storage = storage
+        # folder -> VersionIndex of the versioned file names in it
+        self._folders = {}
+        self._lock = threading.Lock()
+
+    @property
+    def storage(self):
+        # Without an explicit backend, follow whatever set_storage() installed
+        return self._storage or get_storage()
+
+    def _scan(self, folder):
+        index = VersionIndex()
+        with instrumentation.measure("version_resolution", folder) as span:
+            try:
+                names = self.storage.listdir(folder)
+            except OSError:
+                names = []
+            for name in names:
+                index.add(name, name)
+            span.files = len(names)
+        return index
+
+    def version_index(self, folder):
+        """The VersionIndex of folder, whose records are file names."""
+        with self._lock:
+            index = self._folders.get(folder)
+            if index is None:
+                index = self._folders[folder] = self._scan(folder)
+            return index
+
+    def latest_version(self, folder, base_name, extension):
+        """Highest existing version, or 0 when nothing has been published yet."""
+        index = self.version_index(folder)
+        with self._lock:
+            return index.latest_version((base_name, extension))
+
+    def next_version(self, folder, base_name, extension):
+        return self.latest_version(folder, base_name, extension) + 1
+
+    def reserve(self, folder, base_name, extension):
+        """Claim the next free version by creating an empty placeholder in the staging folder.
+
+        Returns (version, path, staged_path).  The caller exports to
+        staged_path, then calls place() and commit(), or release() if the
+        export failed.
+        """
+        os.makedirs(os.path.join(folder, STAGING_FOLDER), exist_ok=True)
+        version = self.next_version(folder, base_name, extension)
+        while True:
+            name = format_versioned_name(base_name, version, extension)
+            path = os.path.join(folder, name)
+            staged_path = staging_path(folder, name)
+            try:
+                handle = os.open(staged_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._expire_claim(staged_path):
+                    continue
+                # Someone else is publishing this version right now
+                version += 1
+                continue
+            os.close(handle)
+            # Checked after claiming: whoever held the claim before us has placed the file by now
+            if os.path.exists(path):
+                os.remove(staged_path)
+                self.commit(folder, base_name, extension, version)
+                version += 1
+                continue
+            return version, path, staged_path
+
+    @staticmethod
+    def _expire_claim(staged_path):
+        """Remove the placeholder at staged_path if it is stale; True if it was removed."""
+        cutoff = time.time() - STALE_CLAIM_HOURS * 3600
+        try:
+            if os.path.getmtime(staged_path) >= cutoff:
+                return False
+            # Moved aside first, so of two sessions expiring it only one succeeds
+            aside = f"{staged_path}.{os.getpid()}.stale"
+            os.rename(staged_path, aside)
+        except OSError:
+            return False
+        if os.path.getmtime(aside) >= cutoff:
+            # Someone expired and re-claimed it in between; give their claim back
+            os.rename(aside, staged_path)
+            return False
+        os.remove(aside)
+        print(f"Removed a stale publish placeholder left by an interrupted publish: {staged_path}")
+        return True
+
+    def place(self, staged_path, path):
+        """Move a finished export from the staging folder to its published name, never over a file."""
+        try:
+            os.link(staged_path, path)
+        except FileExistsError:
+            raise
+        except OSError:
+            # No hardlinks on this filesystem; the claim in reserve() keeps path free
+            os.replace(staged_path, path)
+            return
+        os.remove(staged_path)
+
+    def commit(self, folder, base_name, extension, version):
+        index = self.version_index(folder)
+        name = format_versioned_name(base_name, version, extension)
+        with self._lock:
+            index.add(name, name)
+
+    def release(self, staged_path):
+        """Give back a reserved version whose export failed."""
+        try:
+            os.remove(staged_path)
+        except OSError:
+            pass
+
+    def forget(self, folder=None):
+        with self._lock:
+            if folder is None:
+                self._folders.clear()
+            else:
+                self._folders.pop(folder, None)
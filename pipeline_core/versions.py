@@ -0,0 +1,133 @@
+"""Version resolution shared by the open, save and scene builder tools.
+
+Published files are named <seq>_<desc>_<action>_vNNN.<ext>.  Names are
+parsed once into small VersionedName records and versions are compared as
+integers, so v1000 sorts after v999 no matter how many digits are used.
+VersionIndex groups records by asset (everything before _vNNN, plus the
+extension) and keeps each asset's versions sorted for O(log n) lookups; the
+save tool's VersionRegistry keeps one per export folder, and Scene Builder's
+rollback list is read from one.
+"""
+import bisect
+import re
+
+VERSIONED_NAME_PATTERN = re.compile(r"^(?P<base>.+)_v(?P<version>\d+)\.(?P<ext>[^.]+)$")
+
+
+class VersionedName:
+    __slots__ = ("name", "base", "version", "ext")
+
+    def __init__(self, name, base, version, ext):
+        self.name = name
+        self.base = base
+        self.version = version
+        self.ext = ext
+
+    @property
+    def asset_key(self):
+        return (self.base, self.ext)
+
+    def __repr__(self):
+        return f"VersionedName({self.name!r})"
+
+
+def parse_name(name):
+    match = VERSIONED_NAME_PATTERN.match(name)
+    if match is None:
+        return None
+    return VersionedName(name, match.group("base"), int(match.group("version")), match.group("ext"))
+
+
+def parse_version(name):
+    """Return the integer N of a ..._vN.ext file name, or None."""
+    match = VERSIONED_NAME_PATTERN.match(name)
+    return int(match.group("version")) if match else None
+
+
+def version_sort_key(record):
+    """Sort key for FileRecords: unversioned files first, then by version, mtime and name."""
+    version = record.version
+    return (version is not None, version or 0, record.mtime, record.name)
+
+
+def latest_record(records):
+    """The newest of records by version number rather than by name, or None."""
+    return max(records, key=version_sort_key, default=None)
+
+
+def newest_first(records):
+    return sorted(records, key=version_sort_key, reverse=True)
+
+
+class VersionIndex:
+    """Sorted version list per asset key, built from many records in one pass."""
+
+    def __init__(self):
+        self._versions = {}  # asset key -> sorted version numbers
+        self._records = {}   # (asset key, version) -> record
+
+    @classmethod
+    def from_records(cls, records):
+        """Index FileRecords in one pass, reusing the version they were parsed with."""
+        index = cls()
+        all_versions = index._versions
+        all_records = index._records
+        for record in records:
+            version = record.version
+            if version is None:
+                continue
+            stem, _, ext = record.name.rpartition(".")
+            key = (stem[:stem.rfind("_v")], ext)
+            versions = all_versions.get(key)
+            if versions is None:
+                versions = all_versions[key] = []
+            versions.append(version)
+            all_records[(key, version)] = record
+        for key, versions in all_versions.items():
+            all_versions[key] = sorted(set(versions))
+        return index
+
+    def add(self, record, name=None):
+        parsed = parse_name(name if name is not None else record.name)
+        if parsed is None:
+            return
+        key = parsed.asset_key
+        versions = self._versions.setdefault(key, [])
+        if (key, parsed.version) not in self._records:
+            bisect.insort(versions, parsed.version)
+        self._records[(key, parsed.version)] = record
+
+    def assets(self):
+        return list(self._versions)
+
+    def versions(self, key):
+        return list(self._versions.get(key, ()))
+
+    def get(self, key, version):
+        return self._records.get((key, version))
+
+    def latest_version(self, key):
+        """Highest version of key, or 0 when it has none."""
+        versions = self._versions.get(key)
+        return versions[-1] if versions else 0
+
+    def latest(self, key):
+        versions = self._versions.get(key)
+        return self._records[(key, versions[-1])] if versions else None
+
+    def history(self, key):
+        """Every record of key, newest first."""
+        return [self._records[(key, version)] for version in reversed(self._versions.get(key, ()))]
+
+    def previous(self, key, version):
+        """The newest record older than version, or None."""
+        versions = self._versions.get(key, ())
+        i = bisect.bisect_left(versions, version)
+        return self._records[(key, versions[i - 1])] if i > 0 else None
+
+    def rollback(self, key, steps=1):
+        """The record steps versions behind the latest, or None."""
+        versions = self._versions.get(key, ())
+        if steps < 0 or steps >= len(versions):
+            return None
+        return self._records[(key, versions[-1 - steps])]
@@ -0,0 +1,31 @@
+"""Maya UI for the Group 3 pipeline tools.
+
+Importing this package is cheap: a tool's module, and with it maya.cmds,
+PySide2 and the pipeline_core helpers it uses, is only imported the first
+time that tool is shown.  Each tool keeps its window and re-shows it on
+later calls instead of rebuilding it.
+
+    import pipeline_tools
+    pipeline_tools.show_file_open()
+"""
+import importlib
+
+_SUBMODULES = ("file_open", "save_tool", "scene_builder")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def show_file_open(rebuild=False):
+    return importlib.import_module(f"{__name__}.file_open").carTools(rebuild)
+
+
+def show_save_tool(rebuild=False):
+    return importlib.import_module(f"{__name__}.save_tool").show_save_tool(rebuild)
+
+
+def show_scene_builder(rebuild=False):
+    return importlib.import_module(f"{__name__}.scene_builder").show_tool(rebuild)
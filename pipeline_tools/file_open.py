@@ -0,0 +1,204 @@
+import maya.cmds as cmds
+import os
+import time
+from pipeline_core.project_model import get_project_model
+from pipeline_core.async_scan import LOADING_LABEL, get_scan_service
+from pipeline_tools.menu_sync import sync_option_menu
+from pipeline_tools.timing_panel import show_timing_summary
+
+# What the menus currently show: the folder listed in each menu and the files of the chosen asset
+browser = {"folders": {}, "files": {}, "search": []}
+# "stale" until the search index has been updated since the window was shown, "updating" while that runs
+searchIndexState = {"state": "stale"}
+
+SEARCH_FORMATS = ("All", "abc", "fbx", "mb", "ma", "usd")
+
+def fileSelect(*args):
+    file_path = cmds.fileDialog2(fileMode = 1, caption = "Select File", fileFilter="*.mb;;*.abc;;*.fbx", dir = cmds.workspace(expandName = ""))
+    print(file_path[0])
+    cmds.textField('FilePathField', edit = True, text = file_path[0])
+    
+def fileOpen(*args):
+    file_path = cmds.textField('curPath', query = True, text = True)
+    #cmds.file(f"{base_dir}/{seq}/{seq}_lighting.mb",i=True, mnc=True,rpr="")
+    cmds.file(file_path, o=True)
+
+def get_file_index(project_root=None):
+    # Pass project_root in when calling from a scan thread, cmds is main-thread only
+    project_root = project_root or cmds.workspace(expandName = "")
+    return get_project_model().file_index(project_root)
+
+def list_folders(directory):
+    return get_project_model().folders(directory)
+    
+def list_files(directory):
+    return get_project_model().files(directory)
+
+def listFiles(*args):
+    file_path = cmds.workspace(expandName = "publish\\assets\\character")
+    print(file_path)
+    files = list_folders(file_path)
+    print(files)
+    
+def fillMenu(menuName, labels):
+    sync_option_menu(menuName, labels)
+
+def scanFailed(menuName, message):
+    fillMenu(menuName, [])
+    cmds.warning(message)
+
+def findAssetFiles(project_root, asset):
+    # Runs on a scan thread: file names and paths come from the shared project model
+    return get_project_model().asset_files(project_root, asset)
+
+def listAssetFiles(menuName, asset):
+    cached = get_project_model().cached_asset_files(cmds.workspace(expandName = ""), asset)
+    browser["files"] = cached or {}
+    fillMenu(menuName, list(cached) if cached is not None else [LOADING_LABEL])
+
+    def showAssetFiles(files):
+        browser["files"] = files
+        fillMenu(menuName, list(files))
+
+    get_scan_service().submit(menuName, findAssetFiles, cmds.workspace(expandName = ""), asset,
+                              on_result=showAssetFiles,
+                              on_error=lambda e: scanFailed(menuName, f"Could not list files for {asset}: {e}"))
+    
+def loadMenu(menuName, filePath, dirMode):
+
+    browser["folders"][menuName] = filePath
+    cmds.textField('curPath', edit = True, text=filePath)
+
+    # A folder seen before is shown straight away and corrected if it changed since
+    cached = get_project_model().cached_folders(filePath)
+    fillMenu(menuName, cached if cached is not None else [LOADING_LABEL])
+    get_scan_service().submit(menuName, list_folders, filePath,
+                              on_result=lambda folders: fillMenu(menuName, folders),
+                              on_error=lambda e: scanFailed(menuName, f"Could not list {filePath}: {e}"))
+        
+def setFilePath(fileName):
+    if fileName in browser["files"]:
+        cmds.textField('curPath', edit = True, text=browser["files"][fileName])
+
+def updateSearchIndex(onDone=None):
+    # Runs in the background: refresh the file index and pick up new files for search.
+    # Only one update is asked for at a time, however many keys are typed meanwhile
+    if searchIndexState["state"] == "updating":
+        return
+    searchIndexState["state"] = "updating"
+
+    def updated(index):
+        searchIndexState["state"] = "current"
+        if onDone:
+            onDone()
+
+    def failed(e):
+        searchIndexState["state"] = "stale"
+        cmds.warning(f"Could not index the project for search: {e}")
+
+    get_scan_service().submit("searchIndex", get_project_model().update_search_index, cmds.workspace(expandName = ""),
+                              on_result=updated, on_error=failed)
+
+def searchFilters():
+    kind = cmds.optionMenu('searchKind', query = True, value = True)
+    file_format = cmds.optionMenu('searchFormat', query = True, value = True)
+    min_version = cmds.intField('searchMinVersion', query = True, value = True)
+    max_version = cmds.intField('searchMaxVersion', query = True, value = True)
+    return {
+        "kind": None if kind == "All" else kind,
+        "file_format": None if file_format == "All" else file_format,
+        "shot": cmds.textField('searchShot', query = True, text = True).strip() or None,
+        "asset_type": cmds.textField('searchType', query = True, text = True).strip() or None,
+        "min_version": min_version or None,
+        "max_version": max_version or None,
+    }
+
+def searchFiles(*args):
+    text = cmds.textField('searchField', query = True, text = True)
+    start = time.perf_counter()
+    hits = get_project_model().search(cmds.workspace(expandName = ""), text, **searchFilters())
+    # The index is built on the first search and brought up to date on the first one after each show
+    if hits is None or searchIndexState["state"] == "stale":
+        updateSearchIndex(searchFiles)
+    if hits is None:
+        cmds.text('searchStatus', edit = True, label = "Indexing project...")
+        return
+    seconds = time.perf_counter() - start
+
+    browser["search"] = [hit.record.path for hit in hits]
+    cmds.textScrollList('searchResults', edit = True, removeAll = True)
+    labels = [f"{hit.record.name}   [{hit.kind} {'/'.join(filter(None, (hit.sequence, hit.shot, hit.asset_type)))}]"
+              for hit in hits]
+    if labels:
+        cmds.textScrollList('searchResults', edit = True, append = labels)
+    cmds.text('searchStatus', edit = True, label = f"{len(hits)} matches in {seconds * 1000:.1f} ms" if text.strip() else "")
+
+def searchResultSelected(*args):
+    selected = cmds.textScrollList('searchResults', query = True, selectIndexedItem = True)
+    if selected and selected[0] - 1 < len(browser["search"]):
+        cmds.textField('curPath', edit = True, text = browser["search"][selected[0] - 1])
+
+def carTools(rebuild=False):
+    
+    # Re-show the existing window instead of rebuilding it on every shelf click
+    if cmds.window('carTools', exists = True):
+        if not rebuild:
+            cmds.showWindow('carTools')
+            if searchIndexState["state"] == "current":
+                searchIndexState["state"] = "stale"
+            return
+        cmds.deleteUI('carTools')
+        
+    browser["folders"] = {}
+    browser["files"] = {}
+    cmds.window('carTools', resizeToFitChildren=True)
+    
+#    cmds.window('cameraTools', widthHeight=(200, 450))
+
+    cmds.columnLayout()
+    
+    cmds.separator(h=10)
+    
+    #cmds.text('Open File')
+    #cmds.textField('FilePathField')
+    #cmds.button(label="Browse", command=fileSelect, width=400)
+    #cmds.text('Open File')
+    #cmds.rowLayout(numberOfColumns=2)
+    cmds.button(label = 'Asset Files', command = lambda x: loadMenu("assetType", cmds.workspace(expandName="publish\\assets"),True), width=200)
+    cmds.button(label = 'Sequence Files', command = lambda x: loadMenu("assetType", cmds.workspace(expandName="publish\\sequence"),True), width=200)
+    
+    cmds.optionMenu( "assetType", label='Asset Type:', changeCommand= lambda x: loadMenu("asset", os.path.join(browser["folders"].get("assetType", ""), x), True))
+    cmds.optionMenu( "asset",     label='Assets       :', changeCommand= lambda x: listAssetFiles('file',x))
+    cmds.optionMenu( "file",      label='Files           :', changeCommand= lambda x: setFilePath(x))
+    
+    cmds.text("Current File Path")
+    cmds.textField('curPath', editable = False, width=400)
+
+    cmds.button(label="Open", command=fileOpen, width=400)
+
+    cmds.separator(h=10)
+    cmds.text("Search Project")
+    cmds.textField('searchField', width=400, placeholderText="Part of a file name", textChangedCommand=searchFiles)
+    cmds.rowLayout(numberOfColumns=3)
+    cmds.optionMenu('searchKind', label='Kind:', changeCommand=searchFiles)
+    for kind in ("All", "publish", "wip"):
+        cmds.menuItem(label=kind)
+    cmds.optionMenu('searchFormat', label='Format:', changeCommand=searchFiles)
+    for file_format in SEARCH_FORMATS:
+        cmds.menuItem(label=file_format)
+    cmds.textField('searchShot', placeholderText="Shot", width=100, textChangedCommand=searchFiles)
+    cmds.setParent('..')
+    cmds.rowLayout(numberOfColumns=5)
+    cmds.textField('searchType', placeholderText="Asset type", width=120, textChangedCommand=searchFiles)
+    cmds.text(label=" Versions")
+    cmds.intField('searchMinVersion', value=0, minValue=0, width=60, changeCommand=searchFiles)
+    cmds.text(label="to")
+    cmds.intField('searchMaxVersion', value=0, minValue=0, width=60, changeCommand=searchFiles)
+    cmds.setParent('..')
+    cmds.textScrollList('searchResults', width=400, height=200, selectCommand=searchResultSelected)
+    cmds.text('searchStatus', label="")
+    cmds.button(label="Timings", command=show_timing_summary, width=400)
+    
+    cmds.showWindow('carTools')
+    if searchIndexState["state"] == "current":
+        searchIndexState["state"] = "stale"
@@ -0,0 +1,44 @@
+"""Update optionMenus in place instead of rebuilding them."""
+import difflib
+
+import maya.cmds as cmds
+
+# menu name -> (menuItem names, labels) as last written by sync_option_menu
+_menu_items = {}
+
+
+def menu_labels(menu_name):
+    items = cmds.optionMenu(menu_name, query=True, itemListLong=True) or []
+    cached = _menu_items.get(menu_name)
+    if cached is not None and cached[0] == items:
+        return items, list(cached[1])
+    return items, [cmds.menuItem(item, query=True, label=True) for item in items]
+
+
+def sync_option_menu(menu_name, labels):
+    """Make menu_name show labels, keeping the items it still shows and the selection."""
+    if not cmds.optionMenu(menu_name, exists=True):
+        return
+    items, current = menu_labels(menu_name)
+    labels = list(labels)
+    if current == labels:
+        return
+
+    # Keep every item the new list still has, in order, and insert the new ones
+    # between them; publishes come in at the top, so a prefix alone keeps nothing
+    selected = cmds.optionMenu(menu_name, query=True, value=True) if items else None
+    matcher = difflib.SequenceMatcher(None, current, labels, autojunk=False)
+    kept = []
+    added = set()
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            kept.extend(items[i1:i2])
+            continue
+        for item in items[i1:i2]:
+            cmds.deleteUI(item)
+        for label in labels[j1:j2]:
+            kept.append(cmds.menuItem(label=label, parent=menu_name, insertAfter=kept[-1] if kept else ""))
+            added.add(label)
+    _menu_items[menu_name] = (cmds.optionMenu(menu_name, query=True, itemListLong=True) or kept, labels)
+    if selected in added:
+        cmds.optionMenu(menu_name, edit=True, value=selected)
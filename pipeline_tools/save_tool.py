@@ -0,0 +1,155 @@
+import os
+import maya.cmds as cmds
+from pipeline_core.save_system import ArtistsTimeSortingSaveSystem
+from pipeline_core.async_scan import LOADING_LABEL, get_scan_service
+from pipeline_core.project_model import get_project_model
+from pipeline_tools.menu_sync import menu_labels, sync_option_menu
+from pipeline_tools.timing_panel import show_timing_summary
+
+def select_project_path_ui():
+    selected_path = cmds.fileDialog2(fileMode=3, caption="Select Project Base Path")
+    if selected_path:
+        cmds.textField(project_path_field, edit=True, text=selected_path[0])
+        save_system.set_project_path(selected_path[0])
+        load_folders_ui("exportPathMenu", selected_path[0])
+
+def fill_menu(menu_name, labels):
+    sync_option_menu(menu_name, labels)
+
+def load_folders_ui(menu_name, base_path):
+    previous_labels = [label for label in menu_labels(menu_name)[1] if label != LOADING_LABEL]
+    # 之前浏览过的文件夹直接显示缓存，后台再确认是否有变化
+    cached = get_project_model().cached_folders(base_path)
+    if cached:
+        fill_menu(menu_name, cached)
+        cmds.optionMenu(menu_name, edit=True, changeCommand=lambda x: on_folder_selected(x, base_path))
+    elif cached is None:
+        fill_menu(menu_name, [LOADING_LABEL])
+
+    def show_folders(folders):
+        if not folders:
+            # Leaf folder: keep the menu as it was
+            fill_menu(menu_name, previous_labels)
+            return
+        fill_menu(menu_name, folders)
+        cmds.optionMenu(menu_name, edit=True, changeCommand=lambda x: on_folder_selected(x, base_path))
+
+    def show_error(error):
+        fill_menu(menu_name, previous_labels)
+        cmds.warning(f"Error loading folders: {error}")
+
+    get_scan_service().submit(menu_name, save_system.scan_folders, base_path,
+                              on_result=show_folders, on_error=show_error)
+
+def on_folder_selected(selected_folder, current_path):
+    new_path = os.path.join(current_path, selected_folder)
+    save_system.alembic_path_stack.append(current_path)
+    save_system.set_export_path(new_path)
+    load_folders_ui("exportPathMenu", new_path)
+
+def go_back_ui():
+    if save_system.alembic_path_stack:
+        previous_path = save_system.alembic_path_stack.pop()
+        save_system.set_export_path(previous_path)
+        load_folders_ui("exportPathMenu", previous_path)
+
+def save_file_ui():
+    file_name = cmds.textField(file_entry, query=True, text=True)
+    if not file_name:
+        cmds.confirmDialog(title='Input Error', message="Please enter a file description.")
+        return
+
+    file_formats = []
+    if 'publish' in save_system.export_path:
+        if cmds.checkBox("alembic_checkbox", query=True, value=True):
+            file_formats.append("abc")
+        if cmds.checkBox("fbx_checkbox", query=True, value=True):
+            file_formats.append("fbx")
+        if cmds.checkBox("usd_checkbox", query=True, value=True):
+            file_formats.append("usd")
+    elif 'wip' in save_system.export_path:
+        file_formats.append("mb")
+
+    use_workers = cmds.checkBox("batch_workers_checkbox", query=True, value=True)
+    split_roots = cmds.checkBox("split_roots_checkbox", query=True, value=True)
+    chunk_frames = cmds.intField("chunk_frames_field", query=True, value=True)
+    if (split_roots or chunk_frames) and not use_workers and "abc" in file_formats:
+        cmds.confirmDialog(title='Input Error',
+                           message="Splitting the Alembic export per root or into frame chunks needs "
+                                   "background mayapy workers. Turn them on or clear the split options.")
+        return
+    save_system.split_alembic_roots = split_roots
+    save_system.alembic_chunk_frames = chunk_frames
+    if not use_workers:
+        save_system.batch_workers = 0
+    elif split_roots or chunk_frames:
+        save_system.batch_workers = max(2, (os.cpu_count() or 2) // 2)
+    else:
+        save_system.batch_workers = len(file_formats)
+
+    if cmds.checkBox("playback_range_checkbox", query=True, value=True):
+        save_system.frame_range = None
+    else:
+        # value=True returns all four fields of the group; only the first two are shown
+        save_system.frame_range = (cmds.floatFieldGrp("frame_range_field", query=True, value1=True),
+                                   cmds.floatFieldGrp("frame_range_field", query=True, value2=True))
+
+    result_message = save_system.save_file(file_name, file_formats)
+    cmds.confirmDialog(title='Save Files', message=result_message)
+
+# 创建保存系统实例
+save_system = ArtistsTimeSortingSaveSystem()
+project_path_field = None
+file_entry = None
+
+def show_save_tool(rebuild=False):
+    global project_path_field, file_entry
+
+    # 构建 UI，窗口已存在时直接显示
+    if cmds.window("ArtistsSaveSystem", exists=True):
+        if not rebuild:
+            cmds.showWindow("ArtistsSaveSystem")
+            return
+        cmds.deleteUI("ArtistsSaveSystem")
+
+    window = cmds.window("ArtistsSaveSystem", title="Save and Pulish Tool", widthHeight=(600, 400))
+    cmds.columnLayout(adjustableColumn=True)
+
+    # 基础路径输入
+    cmds.text(label="Project Base Path:")
+    project_path_field = cmds.textField(text="")
+    cmds.button(label="Set Project Path", command=lambda x: select_project_path_ui())
+
+    # 左侧路径选择（保存 Alembic/FBX/USD）
+    cmds.text(label="Select Export Path:")
+    cmds.optionMenu("exportPathMenu", label="Select Path")
+    cmds.button(label="Back", command=lambda x: go_back_ui())
+
+    # 文件名输入框
+    cmds.text(label="File Description:")
+    file_entry = cmds.textField()
+
+    # 文件格式选择
+    cmds.text(label="File Format:")
+    cmds.checkBox("alembic_checkbox", label="Alembic")
+    cmds.checkBox("fbx_checkbox", label="FBX")
+    cmds.checkBox("usd_checkbox", label="USD")
+    cmds.checkBox("batch_workers_checkbox", label="Export in background mayapy workers")
+
+    # 帧范围，默认使用时间滑块的播放范围
+    cmds.checkBox("playback_range_checkbox", label="Use playback range", value=True,
+                  changeCommand=lambda value: cmds.floatFieldGrp("frame_range_field", edit=True, enable=not value))
+    cmds.floatFieldGrp("frame_range_field", label="Frame Range:", numberOfFields=2, value1=1, value2=120, enable=False)
+
+    # 大型 Alembic 拆分导出（需要后台 mayapy）
+    cmds.checkBox("split_roots_checkbox", label="Split Alembic export per root")
+    cmds.rowLayout(numberOfColumns=2)
+    cmds.text(label="Alembic frames per chunk (0 = off):")
+    cmds.intField("chunk_frames_field", value=0, minValue=0)
+    cmds.setParent("..")
+
+    # 保存按钮
+    cmds.button(label="Save Files", command=lambda x: save_file_ui())
+    cmds.button(label="Timings", command=show_timing_summary)
+
+    cmds.showWindow(window)
@@ -0,0 +1,512 @@
+import os
+from PySide2 import QtWidgets, QtCore
+import maya.cmds as cmds
+from PySide2.QtWidgets import QFileDialog
+import time
+from pipeline_core.scan import walk_files
+from pipeline_core.async_scan import LOADING_LABEL, get_scan_service
+from pipeline_core.checksum import same_content
+from pipeline_core.local_cache import get_local_cache
+from pipeline_core.mounts import is_network_path
+from pipeline_core.assembly import assemble_references, print_timings, swap_reference
+from pipeline_core.shot_manifest import ASSET_EXTENSIONS, SHOT_ASSET_FOLDERS, resolve_shot, version_history
+from pipeline_core.shot_builder import asset_namespace, shot_references
+from pipeline_core.storage import get_storage
+from pipeline_core.versions import latest_record
+from pipeline_tools.timing_panel import show_timing_summary
+
+REQUIRED_ASSETS = SHOT_ASSET_FOLDERS
+PLACEHOLDER_ITEMS = ("", "Empty", LOADING_LABEL)
+
+
+# "auto" polls network folders and uses change notifications elsewhere; "poll" or "native" forces one
+WATCH_MODE = os.environ.get("PIPELINE_WATCH_MODE", "auto").lower()
+# Change notifications can still be missed (e.g. a share mounted without them), so
+# natively watched folders are also stat-ed this often; 0 turns that off
+WATCH_BACKSTOP_SECONDS = float(os.environ.get("PIPELINE_WATCH_BACKSTOP_SECONDS", "120"))
+
+
+def latest_asset_record(asset_folder):
+    return latest_record(walk_files(asset_folder, "publish", extensions=ASSET_EXTENSIONS, recursive=False))
+
+
+def list_subfolders(path):
+    storage = get_storage()
+    if not storage.exists(path):
+        return None
+    return storage.list_subfolders(path)
+
+
+def folder_stamp(folder, record):
+    try:
+        folder_mtime = get_storage().stat(folder).mtime
+        file_mtime = get_storage().stat(record.path).mtime if record is not None else None
+    except OSError:
+        return None
+    return folder_mtime, file_mtime
+
+
+def stamp_folders(assets):
+    """Runs on a scan thread: {folder: stamp} of every watched asset folder."""
+    return {folder: folder_stamp(folder, record) for folder, record in assets.values()}
+
+
+def check_asset_folders(assets, dirty, writing):
+    """Runs on a scan thread: look for new versions in the dirty asset folders.
+
+    writing maps a folder to (path, size, mtime) of its latest file as the
+    previous check saw it.  A changed latest file is only trusted once a
+    check finds it the same as the one before, so a file still being copied
+    in is waited out without comparing this machine's clock to the server's.
+
+    Returns (changes, still_writing).  changes maps an asset type to (latest
+    record, reported, stamp), where reported is False for a new version whose
+    content matches the one it replaces; still_writing maps the folders whose
+    latest file hasn't settled yet to what this check saw of it.
+    """
+    changes = {}
+    still_writing = {}
+    for asset_type, (folder, record) in assets.items():
+        if folder not in dirty:
+            continue
+        latest = latest_asset_record(folder)
+        if latest is None:
+            continue
+        if record is None or latest.name != record.name or latest.mtime != record.mtime:
+            seen = (latest.path, latest.size, latest.mtime)
+            if writing.get(folder) != seen:
+                still_writing[folder] = seen
+                continue
+            reported = record is None or latest.path == record.path or not same_content(record.path, latest.path)
+            changes[asset_type] = (latest, reported, folder_stamp(folder, latest))
+    return changes, still_writing
+
+
+class AssetFolderWatcher(QtCore.QObject):
+    """Watches a shot's asset folders and reports new or edited versions.
+
+    Local folders use QFileSystemWatcher, with a slow poll as a backstop;
+    folders on network filesystems (see pipeline_core.mounts), where change
+    notifications miss what other machines write, are polled with one stat
+    per folder and per latest file.  PIPELINE_WATCH_MODE can force either.
+    Bursts of events are debounced, files that are still being written are
+    waited out, and every flush emits one signal for the whole shot.  A new
+    version whose digest matches the one it replaces is tracked silently
+    instead of being reported.  All folder access runs on the scan service.
+    """
+    updates_ready = QtCore.Signal(str, object)
+
+    def __init__(self, parent=None, debounce_ms=2000, poll_ms=15000, backstop_ms=None):
+        super(AssetFolderWatcher, self).__init__(parent)
+        self.shot = None
+        self.assets = {}  # asset type -> (folder, latest FileRecord or None)
+        self.stamps = {}  # folder -> (folder mtime, latest file mtime)
+        self.dirty = set()
+        self.checking = set()  # dirty folders a flush in flight is looking at
+        self.writing = {}  # folder -> (path, size, mtime) of a latest file not settled yet
+        self.active = False
+        self.use_polling = False
+        self.poll_ms = poll_ms
+        self.backstop_ms = int(WATCH_BACKSTOP_SECONDS * 1000) if backstop_ms is None else backstop_ms
+        self.scan_service = get_scan_service()
+
+        self.native = QtCore.QFileSystemWatcher(self)
+        self.native.directoryChanged.connect(self._on_path_changed)
+        self.native.fileChanged.connect(self._on_path_changed)
+
+        self.debounce_timer = QtCore.QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self._flush)
+
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.timeout.connect(self._poll)
+
+    def watch(self, shot, assets):
+        self._disarm()
+        self.shot = shot
+        self.assets = dict(assets)
+        if WATCH_MODE in ("poll", "native"):
+            self.use_polling = WATCH_MODE == "poll"
+        else:
+            self.use_polling = any(is_network_path(folder) for folder, record in self.assets.values())
+        if self.active:
+            self._arm()
+
+    def start(self):
+        self.active = True
+        self._arm()
+
+    def stop(self):
+        self.active = False
+        self._disarm()
+
+    def _disarm(self):
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        # Results of checks still running belong to the old shot
+        self.scan_service.cancel("watcher_poll")
+        self.scan_service.cancel("watcher_flush")
+        self.dirty.clear()
+        self.checking.clear()
+        self.writing.clear()
+        paths = self.native.directories() + self.native.files()
+        if paths:
+            self.native.removePaths(paths)
+
+    def _arm(self):
+        self.stamps = {}
+        self.scan_service.submit("watcher_poll", stamp_folders, dict(self.assets), on_result=self.stamps.update)
+        if self.use_polling:
+            self.poll_timer.setInterval(self.poll_ms)
+            self.poll_timer.start()
+            return
+        paths = []
+        for folder, record in self.assets.values():
+            paths.append(folder)
+            if record is not None:
+                paths.append(record.path)
+        if paths:
+            self.native.addPaths(paths)
+        if self.backstop_ms:
+            self.poll_timer.setInterval(self.backstop_ms)
+            self.poll_timer.start()
+
+    def _on_path_changed(self, path):
+        folders = [folder for folder, record in self.assets.values()]
+        self.dirty.add(path if path in folders else os.path.dirname(path))
+        self.debounce_timer.start()
+
+    def _poll(self):
+        self.scan_service.submit("watcher_poll", stamp_folders, dict(self.assets), on_result=self._apply_stamps)
+
+    def _apply_stamps(self, stamps):
+        for folder, stamp in stamps.items():
+            if stamp != self.stamps.get(folder):
+                self.stamps[folder] = stamp
+                self.dirty.add(folder)
+        if self.dirty and not self.debounce_timer.isActive():
+            self.debounce_timer.start()
+
+    def _flush(self):
+        # A newer flush replaces one in flight, so it checks that one's folders too
+        self.checking |= self.dirty
+        self.dirty = set()
+        self.scan_service.submit("watcher_flush", check_asset_folders, dict(self.assets), set(self.checking),
+                                 dict(self.writing), on_result=self._apply_flush, on_error=self._flush_failed)
+
+    def _apply_flush(self, result):
+        changes, still_writing = result
+        for folder in self.checking:
+            self.writing.pop(folder, None)
+        self.writing.update(still_writing)
+        self.checking = set()
+        updates = {}
+        for asset_type, (latest, reported, stamp) in changes.items():
+            folder, record = self.assets[asset_type]
+            if reported:
+                updates[asset_type] = latest
+            self.assets[asset_type] = (folder, latest)
+            self.stamps[folder] = stamp
+            if not self.use_polling:
+                if record is not None and record.path != latest.path:
+                    self.native.removePath(record.path)
+                self.native.addPath(latest.path)
+
+        self.dirty |= set(still_writing)
+        if self.dirty:
+            self.debounce_timer.start()
+        if updates:
+            self.updates_ready.emit(self.shot, {asset_type: record.name for asset_type, record in updates.items()})
+
+    def _flush_failed(self, error):
+        self.dirty |= self.checking
+        self.checking = set()
+        print(f"Could not check {self.shot} for asset updates: {error}")
+        self.debounce_timer.start()
+
+class AssetLoaderTool(QtWidgets.QWidget):
+    def __init__(self):
+        super(AssetLoaderTool, self).__init__()
+        self.setObjectName("assetLoaderWindow")
+        self.setWindowTitle("Asset Loader Tool")
+        self.setGeometry(300, 300, 500, 500)
+        
+        # 初始化项目路径
+        self.project_folder = None
+        self.update_box = None
+        self.scan_service = get_scan_service()
+        
+        # 创建UI布局
+        self.create_ui()
+
+        # 监视资产文件夹，检测新版本和文件修改
+        self.watcher = AssetFolderWatcher(self)
+        self.watcher.updates_ready.connect(self.on_assets_updated)
+        
+    def create_ui(self):
+        layout = QtWidgets.QVBoxLayout()
+
+        # 搜索项目文件夹按钮
+        self.search_btn = QtWidgets.QPushButton("Search Project Folder")
+        self.search_btn.clicked.connect(self.select_project_folder)
+        layout.addWidget(self.search_btn)
+
+        # 显示选定的项目路径
+        self.project_path_display = QtWidgets.QLabel("No project folder selected")
+        layout.addWidget(self.project_path_display)
+
+        # 序列选择下拉菜单
+        self.sequence_combo = QtWidgets.QComboBox()
+        self.sequence_combo.addItem("Empty")  
+        self.sequence_combo.currentIndexChanged.connect(self.update_shot_list)
+        layout.addWidget(QtWidgets.QLabel("Sequence"))
+        layout.addWidget(self.sequence_combo)
+
+        # 镜头选择
+        self.shot_combo = QtWidgets.QComboBox()
+        self.shot_combo.addItem("Empty")  
+        self.shot_combo.currentIndexChanged.connect(self.update_asset_types)
+        layout.addWidget(QtWidgets.QLabel("Shot"))
+        layout.addWidget(self.shot_combo)
+
+        # 资产类型列表
+        self.asset_type_list = QtWidgets.QListWidget()
+        self.asset_type_list.currentItemChanged.connect(self.update_rollback_list)
+        layout.addWidget(QtWidgets.QLabel("Detected Asset Types"))
+        layout.addWidget(self.asset_type_list)
+
+        # 加载按钮
+        self.load_btn = QtWidgets.QPushButton("Load Latest Asset Versions")
+        self.load_btn.clicked.connect(self.load_assets)
+        layout.addWidget(self.load_btn)
+        self.proxy_first_check = QtWidgets.QCheckBox("Load proxies first")
+        layout.addWidget(self.proxy_first_check)
+        self.local_cache_check = QtWidgets.QCheckBox("Load from local cache")
+        layout.addWidget(self.local_cache_check)
+
+        # 检测更新按钮
+        self.detect_update_btn = QtWidgets.QPushButton("Start Detecting Asset Updates")
+        self.detect_update_btn.clicked.connect(self.start_detection)
+        layout.addWidget(self.detect_update_btn)
+        self.update_status = QtWidgets.QLabel("")
+        layout.addWidget(self.update_status)
+
+        # 回滚选择
+        self.rollback_combo = QtWidgets.QComboBox()
+        layout.addWidget(QtWidgets.QLabel("Select Version to Rollback"))
+        layout.addWidget(self.rollback_combo)
+
+        # 回滚按钮
+        self.rollback_btn = QtWidgets.QPushButton("Rollback to Selected Version")
+        self.rollback_btn.clicked.connect(self.rollback_version)
+        layout.addWidget(self.rollback_btn)
+
+        # 耗时统计
+        self.timings_btn = QtWidgets.QPushButton("Timings")
+        self.timings_btn.clicked.connect(show_timing_summary)
+        layout.addWidget(self.timings_btn)
+
+        # 设置主布局
+        self.setLayout(layout)
+
+    def select_project_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Project Folder")
+        if folder:
+            self.project_folder = folder
+            self.project_path_display.setText(f"Selected Project: {self.project_folder}")
+            self.update_sequence_list()
+
+    def set_loading(self, combo):
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItem(LOADING_LABEL)
+        combo.blockSignals(False)
+
+    def show_items(self, combo, items):
+        combo.clear()
+        if items:
+            combo.addItems(items)
+        else:
+            combo.addItem("Empty")
+
+    def scan_failed(self, combo, error):
+        self.show_items(combo, None)
+        cmds.warning(f"Failed to scan project folder: {error}")
+
+    def update_sequence_list(self):
+        self.set_loading(self.sequence_combo)
+        
+        sequence_path = os.path.join(self.project_folder, "publish", "sequence")
+        self.scan_service.submit("sequence_combo", list_subfolders, sequence_path,
+                                 on_result=lambda sequences: self.show_items(self.sequence_combo, sequences),
+                                 on_error=lambda e: self.scan_failed(self.sequence_combo, e))
+
+    def update_shot_list(self):
+        sequence = self.sequence_combo.currentText()
+        if sequence in PLACEHOLDER_ITEMS:
+            self.scan_service.cancel("shot_combo")
+            self.show_items(self.shot_combo, None)
+            return
+        
+        self.set_loading(self.shot_combo)
+        shot_path = os.path.join(self.project_folder, "publish", "sequence", sequence)
+        self.scan_service.submit("shot_combo", list_subfolders, shot_path,
+                                 on_result=lambda shots: self.show_items(self.shot_combo, shots),
+                                 on_error=lambda e: self.scan_failed(self.shot_combo, e))
+
+    def update_asset_types(self):
+        """根据选定镜头更新资产类型列表"""
+        self.asset_type_list.clear()
+        
+        sequence = self.sequence_combo.currentText()
+        shot = self.shot_combo.currentText()
+        
+        if sequence in PLACEHOLDER_ITEMS or shot in PLACEHOLDER_ITEMS:
+            self.scan_service.cancel("asset_types")
+            return
+
+        # 构建镜头路径
+        shot_path = os.path.join(self.project_folder, "publish", "sequence", sequence, shot)
+        self.asset_type_list.addItem(LOADING_LABEL)
+        self.scan_service.submit("asset_types", resolve_shot, shot_path,
+                                 on_result=lambda assets: self.show_asset_types(sequence, shot, shot_path, assets),
+                                 on_error=lambda e: self.asset_type_list.clear())
+
+    def show_asset_types(self, sequence, shot, shot_path, watched_assets):
+        self.asset_type_list.clear()
+        if watched_assets is None:
+            print(f"Shot path does not exist: {shot_path}")
+            return
+
+        for asset_type, subfolder in REQUIRED_ASSETS.items():
+            asset_folder = os.path.join(shot_path, subfolder)
+            if asset_type in watched_assets:
+                latest = watched_assets[asset_type][1]
+                if latest:
+                    self.asset_type_list.addItem(f"{asset_type} - {latest.name}")
+                else:
+                    print(f"No matching files found in {asset_folder}")
+            else:
+                print(f"Asset folder not found for {asset_type}: {asset_folder}")
+
+        self.update_status.setText("")
+        self.watcher.watch(f"{sequence}/{shot}", watched_assets)
+
+        # 选中镜头后就在后台把最新缓存复制到本地
+        if self.local_cache_check.isChecked():
+            get_local_cache().prefetch([record.path for folder, record in watched_assets.values() if record])
+
+    def localize(self):
+        return get_local_cache().fetch if self.local_cache_check.isChecked() else None
+
+    def load_assets(self):
+        sequence = self.sequence_combo.currentText()
+        shot = self.shot_combo.currentText()
+        
+        if sequence in PLACEHOLDER_ITEMS or shot in PLACEHOLDER_ITEMS:
+            cmds.warning("Please select a sequence and shot.")
+            return
+
+        # 一次性创建所有引用，然后一起加载
+        references = shot_references(self.project_folder, sequence, shot)
+        timings = assemble_references(references, proxy_first=self.proxy_first_check.isChecked(),
+                                      localize=self.localize())
+        for timing in timings:
+            if timing.error:
+                cmds.warning(f"Failed to load asset {timing.path}: {timing.error}")
+            else:
+                print(f"Loaded {timing.path} with namespace {timing.namespace}")
+        print_timings(timings)
+        if self.local_cache_check.isChecked():
+            get_local_cache().save()
+            print(get_local_cache().format_stats())
+            self.update_status.setText(get_local_cache().format_stats())
+
+    def start_detection(self):
+        if not self.watcher.active:
+            self.watcher.start()
+            self.detect_update_btn.setText("Stop Detecting Asset Updates")
+        else:
+            self.watcher.stop()
+            self.detect_update_btn.setText("Start Detecting Asset Updates")
+
+    def on_assets_updated(self, shot, updates):
+        lines = [f"{asset_type} - {name}" for asset_type, name in sorted(updates.items())]
+        message = f"Updates available for {shot}:\n" + "\n".join(lines)
+        self.update_status.setText(message)
+
+        # 同一个非模态窗口，多次更新只显示一条通知
+        if self.update_box is None:
+            self.update_box = QtWidgets.QMessageBox(self)
+            self.update_box.setWindowTitle("Asset Update Detected")
+            self.update_box.setIcon(QtWidgets.QMessageBox.Information)
+            self.update_box.setModal(False)
+        self.update_box.setText(message)
+        self.update_box.show()
+
+    def selected_asset_type(self):
+        item = self.asset_type_list.currentItem()
+        asset_type = item.text().split(" - ")[0] if item else None
+        return asset_type if asset_type in REQUIRED_ASSETS else None
+
+    def update_rollback_list(self, *args):
+        """选中资产时才加载它的历史版本"""
+        self.rollback_combo.clear()
+        sequence = self.sequence_combo.currentText()
+        shot = self.shot_combo.currentText()
+        asset_type = self.selected_asset_type()
+        if not asset_type or sequence in PLACEHOLDER_ITEMS or shot in PLACEHOLDER_ITEMS:
+            self.scan_service.cancel("rollback_combo")
+            return
+
+        shot_path = os.path.join(self.project_folder, "publish", "sequence", sequence, shot)
+        self.rollback_combo.addItem(LOADING_LABEL)
+        self.scan_service.submit("rollback_combo", version_history, shot_path, asset_type,
+                                 on_result=self.show_version_history,
+                                 on_error=lambda e: self.rollback_combo.clear())
+
+    def show_version_history(self, history):
+        self.rollback_combo.clear()
+        for entry in history:
+            record = entry.record
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(record.mtime))
+            label = f"{record.name}  ({record.size / (1024 * 1024):.1f} MB, {modified}, {entry.publisher or 'unknown'})"
+            self.rollback_combo.addItem(label, record.path)
+
+    def rollback_version(self):
+        sequence = self.sequence_combo.currentText()
+        shot = self.shot_combo.currentText()
+        asset_type = self.selected_asset_type()
+        rollback_file = self.rollback_combo.currentData()
+
+        if not asset_type or not rollback_file:
+            cmds.warning("Please select an asset and version to rollback.")
+            return
+
+        # 直接替换已有引用，而不是再创建一个新的命名空间
+        namespace = asset_namespace(sequence, shot, asset_type)
+        try:
+            localize = self.localize()
+            swap_reference(namespace, localize(rollback_file) if localize else rollback_file)
+            print(f"Rolled back {namespace} to {rollback_file}")
+        except Exception as e:
+            cmds.warning(f"Failed to rollback to version {os.path.basename(rollback_file)}: {e}")
+
+asset_loader_window = None
+
+def show_tool(rebuild=False):
+    global asset_loader_window
+    # 工具窗口只创建一次，之后直接重新显示
+    if asset_loader_window is not None and not rebuild:
+        asset_loader_window.show()
+        asset_loader_window.raise_()
+        asset_loader_window.activateWindow()
+        return asset_loader_window
+
+    if asset_loader_window is not None:
+        asset_loader_window.close()
+        asset_loader_window.deleteLater()
+    asset_loader_window = AssetLoaderTool()
+    asset_loader_window.show()
+    return asset_loader_window
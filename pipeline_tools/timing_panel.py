@@ -0,0 +1,39 @@
+"""Timing summary window shared by the pipeline tools."""
+import maya.cmds as cmds
+
+from pipeline_core import instrumentation
+
+WINDOW_NAME = "pipelineTimingSummary"
+
+
+def refresh_timing_summary(*args):
+    if cmds.window(WINDOW_NAME, exists=True):
+        cmds.scrollField("timingSummaryText", edit=True, text=instrumentation.format_summary())
+        cmds.button("timingRecordButton", edit=True,
+                    label="Stop Recording" if instrumentation.is_enabled() else "Start Recording")
+
+
+def toggle_recording(*args):
+    if instrumentation.is_enabled():
+        instrumentation.disable()
+    else:
+        instrumentation.enable()
+    refresh_timing_summary()
+
+
+def clear_timings(*args):
+    instrumentation.clear()
+    refresh_timing_summary()
+
+
+def show_timing_summary(*args):
+    if not cmds.window(WINDOW_NAME, exists=True):
+        cmds.window(WINDOW_NAME, title="Pipeline Timings", widthHeight=(620, 260))
+        cmds.columnLayout(adjustableColumn=True)
+        cmds.scrollField("timingSummaryText", editable=False, wordWrap=False, font="fixedWidthFont", height=200)
+        cmds.rowLayout(numberOfColumns=3)
+        cmds.button("timingRecordButton", label="Start Recording", command=toggle_recording, width=200)
+        cmds.button(label="Refresh", command=refresh_timing_summary, width=200)
+        cmds.button(label="Clear", command=clear_timings, width=200)
+    refresh_timing_summary()
+    cmds.showWindow(WINDOW_NAME)
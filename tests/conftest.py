@@ -0,0 +1,4 @@
+"""maya.cmds is the recording stub from benchmarks for every test, so no Maya is needed."""
+from benchmarks import maya_stub
+
+maya_stub.install()
@@ -0,0 +1,139 @@
+"""export_chunked against stand-in mayapy and AbcStitcher executables.
+
+The stand-ins write text instead of Alembic: an exported part holds one
+line per root, "<root> <start>-<end>", the stitcher joins its inputs' frame
+ranges root by root, and a merge concatenates its inputs.  The stitcher
+fails the way the real one would when given its arguments in the wrong
+order, and the stand-in mayapy fails for a root named in $FAIL_ROOT.
+"""
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from pipeline_core import alembic_chunks
+from pipeline_core.alembic_chunks import export_chunked
+from pipeline_core.publish import PublishSnapshot
+
+MAYAPY = """#!{python}
+import os
+import sys
+args = sys.argv[3:]
+if args[0] == "merge":
+    output, parts = args[1], args[4:]
+    with open(output, "w") as handle:
+        for part in parts:
+            handle.write(open(part).read())
+else:
+    scene, file_format, output, start, end = args[:5]
+    if os.environ.get("FAIL_ROOT") in args[5:]:
+        sys.exit("worker died")
+    with open({log!r}, "a") as log:
+        log.write(output + "\\n")
+    with open(output, "w") as handle:
+        for root in args[5:]:
+            handle.write(f"{{root}} {{float(start):g}}-{{float(end):g}}\\n")
+"""
+
+ABC_STITCHER = """#!{python}
+import os
+import sys
+output, inputs = sys.argv[1], sys.argv[2:]
+if len(inputs) < 2 or os.path.exists(output) or not all(os.path.exists(path) for path in inputs):
+    sys.stderr.write("usage: AbcStitcher outFile.abc inFile1.abc inFile2.abc ...\\n")
+    sys.exit(1)
+ranges = {{}}
+for path in inputs:
+    for line in open(path):
+        root, frames = line.split()
+        start, end = frames.split("-")
+        ranges.setdefault(root, []).append((start, end))
+with open(output, "w") as handle:
+    for root, chunks in ranges.items():
+        handle.write(f"{{root}} {{chunks[0][0]}}-{{chunks[-1][1]}}\\n")
+"""
+
+
+def write_script(path, text, **values):
+    with open(path, "w") as handle:
+        handle.write(text.format(python=sys.executable, **values))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    monkeypatch.setattr(alembic_chunks, "WORK_ROOT", str(tmp_path / "parts"))
+    log = str(tmp_path / "exports.log")
+    mayapy = write_script(str(tmp_path / "mayapy"), MAYAPY, log=log)
+    write_script(str(tmp_path / "AbcStitcher"), ABC_STITCHER)
+    return mayapy, log
+
+
+def exported_parts(log):
+    return open(log).read().split() if os.path.exists(log) else []
+
+
+@pytest.mark.parametrize("per_root", [False, True])
+def test_frame_chunks_are_stitched_into_the_whole_range(tmp_path, tools, per_root):
+    mayapy, log = tools
+    output = str(tmp_path / "hero_v001.abc")
+    snapshot = PublishSnapshot(["hero", "prop"], (1001.0, 1030.0), "scene.mb")
+    export_chunked(output, snapshot, "snapshot.mb", mayapy, 4, "key", per_root=per_root, chunk_frames=10)
+    assert sorted(open(output).read().split("\n")[:-1]) == ["hero 1001-1030", "prop 1001-1030"]
+    assert len(exported_parts(log)) == (6 if per_root else 3)
+    # Finished work folders are removed
+    assert os.listdir(alembic_chunks.WORK_ROOT) == []
+
+
+def test_one_chunk_per_root_skips_the_stitcher(tmp_path, tools):
+    mayapy, log = tools
+    os.remove(os.path.join(os.path.dirname(mayapy), "AbcStitcher"))
+    output = str(tmp_path / "hero_v001.abc")
+    snapshot = PublishSnapshot(["hero", "prop"], (1.0, 50.0), "scene.mb")
+    export_chunked(output, snapshot, "snapshot.mb", mayapy, 2, "key", per_root=True, chunk_frames=10)
+    assert open(output).read() == "hero 1-50\nprop 1-50\n"
+
+
+def test_a_retry_only_exports_the_parts_that_failed(tmp_path, tools, monkeypatch):
+    mayapy, log = tools
+    output = str(tmp_path / "hero_v001.abc")
+    snapshot = PublishSnapshot(["hero", "prop"], (1.0, 20.0), "scene.mb")
+    monkeypatch.setenv("FAIL_ROOT", "prop")
+    with pytest.raises(RuntimeError):
+        export_chunked(output, snapshot, "snapshot.mb", mayapy, 1, "key", per_root=True, chunk_frames=10)
+    assert len(exported_parts(log)) == 2
+    monkeypatch.delenv("FAIL_ROOT")
+    export_chunked(output, snapshot, "snapshot.mb", mayapy, 1, "key", per_root=True, chunk_frames=10)
+    assert len(exported_parts(log)) == 4
+    assert open(output).read() == "hero 1-20\nprop 1-20\n"
+
+
+def test_old_work_folders_are_swept(tmp_path, tools):
+    mayapy, log = tools
+    old = os.path.join(alembic_chunks.WORK_ROOT, "old")
+    recent = os.path.join(alembic_chunks.WORK_ROOT, "recent")
+    for folder in (old, recent):
+        os.makedirs(folder)
+    stale = time.time() - (alembic_chunks.WORK_FOLDER_DAYS + 1) * 24 * 3600
+    os.utime(old, (stale, stale))
+    snapshot = PublishSnapshot(["hero"], (1.0, 20.0), "scene.mb")
+    export_chunked(str(tmp_path / "hero_v001.abc"), snapshot, "snapshot.mb", mayapy, 1, "key", chunk_frames=10)
+    assert os.listdir(alembic_chunks.WORK_ROOT) == ["recent"]
+
+
+def test_resume_key_is_stable_for_a_saved_scene(tmp_path):
+    from pipeline_core.publish import snapshot_resume_key
+    scene = tmp_path / "SH010_anim.mb"
+    scene.write_text("scene")
+    snapshot = PublishSnapshot(["hero"], (1.0, 20.0), str(scene))
+    key = snapshot_resume_key(snapshot, "hero")
+    assert snapshot_resume_key(snapshot, "hero") == key
+    # Saved again: different content, so a fresh start
+    os.utime(scene, (1, 1))
+    assert snapshot_resume_key(snapshot, "hero") != key
+    # Never saved: nothing stable to key on
+    untitled = snapshot._replace(scene="")
+    assert snapshot_resume_key(untitled, "hero") != snapshot_resume_key(untitled, "hero")
@@ -0,0 +1,105 @@
+"""Two LocalCache sessions sharing one cache folder."""
+import json
+import os
+import time
+
+import pytest
+
+from pipeline_core import local_cache
+from pipeline_core.local_cache import INDEX_FILE_NAME, LocalCache
+
+SIZE = 100
+
+
+@pytest.fixture
+def sources(tmp_path):
+    folder = tmp_path / "publish"
+    folder.mkdir()
+    paths = []
+    for number in range(6):
+        path = folder / f"hero_v{number + 1:03d}.abc"
+        path.write_bytes(bytes([number]) * SIZE)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def root(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def index_on_disk(root):
+    with open(os.path.join(root, INDEX_FILE_NAME)) as handle:
+        return json.load(handle)
+
+
+def test_sessions_merge_their_entries(root, sources):
+    first, second = LocalCache(root, max_bytes=10 * SIZE), LocalCache(root, max_bytes=10 * SIZE)
+    first.fetch(sources[0])
+    second.fetch(sources[1])
+    first.fetch(sources[2])
+    keys = {LocalCache.cache_key(source) for source in sources[:3]}
+    assert set(index_on_disk(root)) == keys
+    # A save takes in what the other session added
+    assert set(first.entries) == keys
+
+
+def test_a_hit_is_saved_with_the_next_save(root, sources):
+    cache = LocalCache(root, max_bytes=10 * SIZE)
+    cache.fetch(sources[0])
+    key = LocalCache.cache_key(sources[0])
+    copied = index_on_disk(root)[key]["last_used"]
+    time.sleep(0.01)
+    local = cache.fetch(sources[0])
+    assert local != sources[0] and cache.hits == 1
+    assert index_on_disk(root)[key]["last_used"] == copied
+    cache.save()
+    assert index_on_disk(root)[key]["last_used"] > copied
+
+
+def test_eviction_covers_both_sessions_least_recently_used_first(root, sources):
+    first, second = LocalCache(root, max_bytes=3 * SIZE), LocalCache(root, max_bytes=3 * SIZE)
+    first.fetch(sources[0])
+    second.fetch(sources[1])
+    first.fetch(sources[2])
+    time.sleep(0.01)
+    # A hit in the first session makes sources[0] the most recently used
+    first.fetch(sources[0])
+    first.save()
+    evicted = first.entries[LocalCache.cache_key(sources[1])]["local"]
+    second.fetch(sources[3])
+    on_disk = index_on_disk(root)
+    assert set(on_disk) == {LocalCache.cache_key(source) for source in (sources[0], sources[2], sources[3])}
+    assert sum(entry["size"] for entry in on_disk.values()) <= 3 * SIZE
+    assert not os.path.exists(evicted)
+
+
+def test_an_entry_evicted_by_one_session_is_not_brought_back_by_the_other(root, sources):
+    first, second = LocalCache(root, max_bytes=10 * SIZE), LocalCache(root, max_bytes=10 * SIZE)
+    first.fetch(sources[0])
+    second.save()
+    first.clear()
+    # second still holds the entry in memory; its local copy is gone
+    second.fetch(sources[1])
+    assert set(index_on_disk(root)) == {LocalCache.cache_key(sources[1])}
+
+
+def test_only_old_orphans_are_removed(root, sources):
+    first = LocalCache(root, max_bytes=10 * SIZE)
+    first.fetch(sources[0])
+    folder = os.path.join(root, "ab")
+    os.makedirs(folder, exist_ok=True)
+    old, recent = os.path.join(folder, "ab_old.abc"), os.path.join(folder, "ab_recent.abc")
+    for path in (old, recent):
+        with open(path, "wb") as handle:
+            handle.write(b"x")
+    stale = time.time() - local_cache.ORPHAN_AGE_SECONDS - 60
+    os.utime(old, (stale, stale))
+    # Indexed copies are kept however old they are
+    indexed = first.entries[LocalCache.cache_key(sources[0])]["local"]
+    os.utime(indexed, (stale, stale))
+
+    LocalCache(root, max_bytes=10 * SIZE).fetch(sources[1])
+    assert not os.path.exists(old)
+    assert os.path.exists(recent)
+    assert os.path.exists(indexed)
@@ -0,0 +1,67 @@
+"""sync_option_menu against the maya stub, over seeded random label lists."""
+import random
+
+import maya.cmds as cmds
+import pytest
+
+from pipeline_tools import menu_sync
+from pipeline_tools.menu_sync import sync_option_menu
+
+SEEDS = range(30)
+
+
+@pytest.fixture
+def menu(request):
+    name = f"menu_{request.node.name}"
+    cmds.optionMenu(name)
+    yield name
+    menu_sync._menu_items.pop(name, None)
+
+
+def versions(count, start=1):
+    return [f"hero_v{number:03d}.abc" for number in range(start + count - 1, start - 1, -1)]
+
+
+def item_calls():
+    return len(cmds.calls_to("menuItem")) + len(cmds.calls_to("deleteUI"))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_menu_shows_exactly_the_labels_given(menu, seed):
+    rng = random.Random(seed)
+    labels = versions(rng.randint(0, 40))
+    for _ in range(30):
+        labels = [label for label in labels if rng.random() > 0.1]
+        for _ in range(rng.randint(0, 4)):
+            labels.insert(rng.randint(0, len(labels)), f"(wip)prop_v{rng.randint(1, 99):03d}.mb")
+        if rng.random() < 0.1:
+            rng.shuffle(labels)
+        sync_option_menu(menu, labels)
+        assert cmds.menu_contents(menu) == labels
+
+
+def test_a_new_publish_on_top_only_adds_its_item(menu):
+    sync_option_menu(menu, versions(200))
+    kept = cmds.optionMenu(menu, query=True, itemListLong=True)
+    before = item_calls()
+    sync_option_menu(menu, versions(201))
+    assert item_calls() - before == 1
+    assert cmds.optionMenu(menu, query=True, itemListLong=True)[1:] == kept
+
+
+def test_an_unchanged_menu_is_left_alone(menu):
+    sync_option_menu(menu, versions(20))
+    before = item_calls()
+    sync_option_menu(menu, versions(20))
+    assert item_calls() == before
+
+
+def test_the_selection_survives_its_item_being_recreated(menu):
+    sync_option_menu(menu, ["a", "b", "c", "d"])
+    cmds.optionMenu(menu, edit=True, value="b")
+    item = cmds.optionMenu(menu, query=True, itemListLong=True)[1]
+    # b moves behind the items it was in front of, so its item is deleted and created again
+    sync_option_menu(menu, ["a", "c", "d", "b"])
+    assert item not in cmds.optionMenu(menu, query=True, itemListLong=True)
+    assert cmds.menu_contents(menu) == ["a", "c", "d", "b"]
+    assert cmds.optionMenu(menu, query=True, value=True) == "b"
@@ -0,0 +1,72 @@
+"""VersionRegistry.reserve() / place() with several processes publishing into one folder."""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pipeline_core import version_registry
+from pipeline_core.version_registry import STAGING_FOLDER, VersionRegistry, format_versioned_name
+
+PUBLISHES = 24
+
+
+def publish(folder, base_name="hero", extension="abc"):
+    """One publish as its own process would make it; returns the version it got."""
+    registry = VersionRegistry()
+    version, path, staged_path = registry.reserve(folder, base_name, extension)
+    with open(staged_path, "w") as handle:
+        handle.write(f"{os.getpid()} {version}")
+    time.sleep(0.01)
+    registry.place(staged_path, path)
+    registry.commit(folder, base_name, extension, version)
+    return version
+
+
+def test_concurrent_publishes_get_distinct_consecutive_versions(tmp_path):
+    folder = str(tmp_path)
+    with ProcessPoolExecutor(max_workers=6) as pool:
+        versions = list(pool.map(publish, [folder] * PUBLISHES))
+    assert sorted(versions) == list(range(1, PUBLISHES + 1))
+    for version in versions:
+        with open(os.path.join(folder, format_versioned_name("hero", version, "abc"))) as handle:
+            assert handle.read().split()[1] == str(version)
+    assert os.listdir(os.path.join(folder, STAGING_FOLDER)) == []
+
+
+def test_a_version_published_after_the_scan_is_skipped(tmp_path):
+    folder = str(tmp_path)
+    registry = VersionRegistry()
+    assert registry.next_version(folder, "hero", "abc") == 1
+    # Another machine publishes v001 after this registry listed the folder
+    (tmp_path / "hero_v001.abc").write_text("theirs")
+    version, path, staged_path = registry.reserve(folder, "hero", "abc")
+    assert version == 2 and path.endswith("hero_v002.abc")
+    assert registry.next_version(folder, "hero", "abc") == 2
+
+
+def test_place_never_overwrites_a_published_file(tmp_path):
+    registry = VersionRegistry()
+    version, path, staged_path = registry.reserve(str(tmp_path), "hero", "abc")
+    with open(path, "w") as handle:
+        handle.write("theirs")
+    with pytest.raises(FileExistsError):
+        registry.place(staged_path, path)
+    registry.release(staged_path)
+    assert open(path).read() == "theirs"
+    assert os.listdir(os.path.join(str(tmp_path), STAGING_FOLDER)) == []
+
+
+def test_released_and_stale_claims_are_reused(tmp_path):
+    folder = str(tmp_path)
+    registry = VersionRegistry()
+    first = registry.reserve(folder, "hero", "abc")
+    registry.release(first[2])
+    assert registry.reserve(folder, "hero", "abc")[0] == first[0]
+
+    # A claim held by a live publish is skipped, a crashed session's old one is taken over
+    fresh = registry.reserve(folder, "hero", "abc")
+    assert fresh[0] == first[0] + 1
+    stale = time.time() - version_registry.STALE_CLAIM_HOURS * 3600 - 60
+    os.utime(fresh[2], (stale, stale))
+    assert VersionRegistry().reserve(folder, "hero", "abc")[0] == fresh[0]
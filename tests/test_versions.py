@@ -0,0 +1,158 @@
+"""Property tests for pipeline_core.versions and the version registry.
+
+Each property is checked against many randomly generated cases from fixed
+seeds, so a failure always reproduces; the seed is in the test id.
+"""
+import random
+
+import pytest
+
+from pipeline_core.scan import FileRecord
+from pipeline_core.storage import MemoryStorage
+from pipeline_core.version_registry import VersionRegistry, format_versioned_name
+from pipeline_core.versions import (VersionIndex, latest_record, newest_first, parse_name, parse_version,
+                                    version_sort_key)
+
+SEEDS = range(50)
+EXTENSIONS = ("abc", "fbx", "mb", "ma", "usd")
+WORDS = ("SH010", "SQ01", "char", "hero", "prop", "animation", "layout", "set", "v2", "x_v")
+
+
+def random_base(rng):
+    return "_".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+
+
+def random_name(rng, base=None, ext=None, version=None):
+    base = base or random_base(rng)
+    version = version if version is not None else rng.randint(0, 20000)
+    padding = rng.randint(1, 6)
+    return f"{base}_v{str(version).zfill(padding)}.{ext or rng.choice(EXTENSIONS)}", base, version
+
+
+def record(name, mtime=0.0):
+    return FileRecord(name, "/publish/" + name, "publish", 0, mtime, parse_version(name))
+
+
+def random_records(rng, assets=4, count=60):
+    keys = [(random_base(rng), rng.choice(EXTENSIONS)) for _ in range(assets)]
+    records = {}
+    for _ in range(count):
+        base, ext = rng.choice(keys)
+        name, base, version = random_name(rng, base, ext)
+        records[name] = record(name, rng.random())
+    return list(records.values())
+
+
+def model_versions(records):
+    """{asset key: {version: record}} built the slow, obvious way."""
+    model = {}
+    for rec in records:
+        parsed = parse_name(rec.name)
+        model.setdefault(parsed.asset_key, {})[parsed.version] = rec
+    return model
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_parse_name_round_trips(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        ext = rng.choice(EXTENSIONS)
+        name, base, version = random_name(rng, ext=ext)
+        parsed = parse_name(name)
+        assert (parsed.base, parsed.version, parsed.ext) == (base, version, ext)
+        assert parse_version(name) == version
+        assert parse_name(format_versioned_name(base, version, ext)).version == version
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_names_without_a_version_suffix_do_not_parse(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        base = random_base(rng) + "_" + rng.choice(WORDS[:-2])
+        for name in (f"{base}.{rng.choice(EXTENSIONS)}", f"{base}_v.{rng.choice(EXTENSIONS)}",
+                     f"{base}_v{rng.randint(0, 99)}", f"{base}_v{rng.randint(0, 99)}x.abc"):
+            assert parse_name(name) is None
+            assert parse_version(name) is None
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_latest_record_is_the_highest_version_whatever_the_padding_or_order(seed):
+    rng = random.Random(seed)
+    base, ext = random_base(rng), rng.choice(EXTENSIONS)
+    records = [record(random_name(rng, base, ext, version)[0], rng.random())
+               for version in rng.sample(range(1, 3000), rng.randint(1, 40))]
+    rng.shuffle(records)
+    highest = max(records, key=lambda rec: rec.version)
+    assert latest_record(records) is highest
+    assert newest_first(records)[0] is highest
+    assert [rec.version for rec in newest_first(records)] == sorted((rec.version for rec in records), reverse=True)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_unversioned_records_sort_before_every_version(seed):
+    rng = random.Random(seed)
+    records = random_records(rng) + [record(f"{random_base(rng)}.mb", rng.random()) for _ in range(5)]
+    rng.shuffle(records)
+    ordered = sorted(records, key=version_sort_key)
+    versions = [rec.version for rec in ordered]
+    unversioned = versions.count(None)
+    assert all(version is None for version in versions[:unversioned])
+    assert versions[unversioned:] == sorted(versions[unversioned:])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_index_lookups_match_a_brute_force_model(seed):
+    rng = random.Random(seed)
+    records = random_records(rng)
+    index = VersionIndex.from_records(records)
+    model = model_versions(records)
+    assert sorted(index.assets()) == sorted(model)
+    for key, versions in model.items():
+        ordered = sorted(versions)
+        assert index.versions(key) == ordered
+        assert index.latest_version(key) == ordered[-1]
+        assert index.latest(key) is versions[ordered[-1]]
+        assert index.history(key) == [versions[version] for version in reversed(ordered)]
+        for steps in range(len(ordered) + 2):
+            expected = versions[ordered[-1 - steps]] if steps < len(ordered) else None
+            assert index.rollback(key, steps) is expected
+        for probe in ordered + [0, ordered[-1] + 1, rng.randint(0, 20001)]:
+            older = [version for version in ordered if version < probe]
+            assert index.previous(key, probe) is (versions[older[-1]] if older else None)
+    missing = ("no such asset", "abc")
+    assert index.latest(missing) is None and index.latest_version(missing) == 0 and index.history(missing) == []
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_adding_one_at_a_time_matches_building_in_one_pass(seed):
+    rng = random.Random(seed)
+    records = random_records(rng)
+    built = VersionIndex.from_records(records)
+    added = VersionIndex()
+    for rec in rng.sample(records, len(records)):
+        added.add(rec)
+    for key in built.assets():
+        assert added.versions(key) == built.versions(key)
+        assert added.history(key) == built.history(key)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_registry_hands_out_the_version_after_the_highest_seen(seed):
+    rng = random.Random(seed)
+    storage = MemoryStorage()
+    folder = "/project/publish/sequence/SQ01/SH010/animation/caches/alembic"
+    storage.makedirs(folder)
+    base, ext = random_base(rng), rng.choice(EXTENSIONS)
+    published = rng.sample(range(1, 2000), rng.randint(0, 20))
+    for version in published:
+        storage.add_file(f"{folder}/{random_name(rng, base, ext, version)[0]}")
+    registry = VersionRegistry(storage)
+    expected = max(published, default=0) + 1
+    assert registry.next_version(folder, base, ext) == expected
+    for _ in range(5):
+        committed = rng.randint(1, expected + 5)
+        registry.commit(folder, base, ext, committed)
+        expected = max(expected, committed + 1)
+        assert registry.next_version(folder, base, ext) == expected
+    # Other assets in the same folder never affect it
+    assert registry.next_version(folder, base + "_other", ext) == 1